@@ -0,0 +1,271 @@
+"""
+Mergeable Partial Aggregates for Airbnb Analytics
+Business Intelligence Engineer - Aggregation Module
+
+Partial aggregates are kept at the (city, period, host_is_superhost) grain:
+counts, sums and sums of squares for every measure the analytical queries
+need, plus a log-bucketed quantile sketch of realSum for medians and a
+co-moment matrix for correlations. Two partials over disjoint sets of
+listings merge by adding their counters, so results computed on separate
+shards (or separate batches) combine into the same answers AirbnbAnalytics
+produces on the full frame. Medians come from the sketch and are accurate
+to RELATIVE_ACCURACY.
+"""
+
+from functools import reduce
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+GRAIN = ['city', 'period', 'host_is_superhost']
+SUM_COLUMNS = ['realSum', 'guest_satisfaction_overall', 'cleanliness_rating',
+               'price_per_person', 'person_capacity', 'bedrooms']
+CORR_COLUMNS = ['realSum', 'person_capacity', 'bedrooms',
+                'cleanliness_rating', 'guest_satisfaction_overall',
+                'dist', 'metro_dist', 'attr_index_norm',
+                'rest_index_norm', 'price_per_person', 'location_score']
+
+# Relative error bound of sketch quantiles (DDSketch-style log buckets)
+RELATIVE_ACCURACY = 0.005
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = np.log(_GAMMA)
+# Bucket used for non-positive prices, represented as zero
+_ZERO_BUCKET = np.iinfo(np.int32).min
+
+
+class PartialAggregates:
+    """Mergeable counts, sums and price sketches for a subset of listings"""
+
+    def __init__(self, totals: pd.DataFrame, sketch: pd.DataFrame, comoments: pd.DataFrame):
+        """
+        Initialize from pre-aggregated frames
+
+        Args:
+            totals: One row per GRAIN group with 'count', 'sum_<col>' and 'sumsq_realSum'
+            sketch: One row per GRAIN group and price bucket with a 'count'
+            comoments: X'X for X = [CORR_COLUMNS, 1], labelled with a trailing '_n'
+        """
+        self.totals = totals
+        self.sketch = sketch
+        self.comoments = comoments
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'PartialAggregates':
+        """
+        Aggregate a processed DataFrame
+
+        Args:
+            df: Processed Airbnb DataFrame (or a shard/batch of it)
+
+        Returns:
+            Partial aggregates for the rows of df
+        """
+        measures = df[GRAIN + SUM_COLUMNS].copy()
+        measures['sumsq_realSum'] = df['realSum'] ** 2
+        measures = measures.rename(columns={col: f"sum_{col}" for col in SUM_COLUMNS})
+
+        grouped = measures.groupby(GRAIN, observed=True)
+        totals = grouped.sum()
+        totals.insert(0, 'count', grouped.size())
+
+        buckets = pd.DataFrame({col: df[col] for col in GRAIN})
+        buckets['bucket'] = cls._bucket_index(df['realSum'].to_numpy(dtype=float))
+        sketch = buckets.groupby(GRAIN + ['bucket'], observed=True).size().rename('count').to_frame()
+
+        corr_cols = [col for col in CORR_COLUMNS if col in df.columns]
+        design = np.column_stack([df[corr_cols].to_numpy(dtype=float), np.ones(len(df))])
+        labels = corr_cols + ['_n']
+        comoments = pd.DataFrame(design.T @ design, index=labels, columns=labels)
+
+        return cls(totals, sketch, comoments)
+
+    @classmethod
+    def empty(cls) -> 'PartialAggregates':
+        """Partial aggregates of zero listings"""
+        columns = ['count'] + [f"sum_{col}" for col in SUM_COLUMNS] + ['sumsq_realSum']
+        totals = pd.DataFrame(columns=GRAIN + columns).set_index(GRAIN)
+        sketch = pd.DataFrame(columns=GRAIN + ['bucket', 'count']).set_index(GRAIN + ['bucket'])
+        comoments = pd.DataFrame(0.0, index=['_n'], columns=['_n'])
+        return cls(totals, sketch, comoments)
+
+    @classmethod
+    def combine(cls, parts: Iterable['PartialAggregates']) -> 'PartialAggregates':
+        """
+        Merge partial aggregates computed over disjoint listings
+
+        Args:
+            parts: Partial aggregates to merge
+
+        Returns:
+            Merged partial aggregates
+        """
+        parts = [part for part in parts if len(part.totals) > 0]
+        if not parts:
+            return cls.empty()
+
+        totals = pd.concat([part.totals for part in parts]).groupby(level=GRAIN).sum()
+        sketch = pd.concat([part.sketch for part in parts]).groupby(level=GRAIN + ['bucket']).sum()
+        labels = parts[0].comoments.index
+        comoments = reduce(lambda a, b: a.add(b, fill_value=0), [part.comoments for part in parts])
+        return cls(totals, sketch, comoments.loc[labels, labels])
+
+    def merge(self, other: 'PartialAggregates') -> 'PartialAggregates':
+        """Merge with another partial aggregate over disjoint listings"""
+        return PartialAggregates.combine([self, other])
+
+    @property
+    def record_count(self) -> int:
+        """Number of listings covered"""
+        return int(self.totals['count'].sum())
+
+    # ------------------------------------------------------------------
+    # Queries (same output shape as AirbnbAnalytics)
+    # ------------------------------------------------------------------
+
+    def top_n_cities_by_price(self, n: int = 5) -> pd.DataFrame:
+        """Query: Top N cities by average price"""
+        city = self._rollup(['city'])
+        result = pd.DataFrame({
+            'avg_price': city['sum_realSum'] / city['count'],
+            'median_price': self._median(['city']),
+            'listing_count': city['count']
+        }).reset_index()
+        result = result.sort_values('avg_price', ascending=False).head(n)
+        return result
+
+    def superhost_performance_analysis(self) -> pd.DataFrame:
+        """Query: Superhost vs regular host performance"""
+        host = self._rollup(['host_is_superhost'])
+        result = pd.DataFrame({
+            'avg_price': host['sum_realSum'] / host['count'],
+            'median_price': self._median(['host_is_superhost']),
+            'avg_satisfaction': host['sum_guest_satisfaction_overall'] / host['count'],
+            'avg_cleanliness': host['sum_cleanliness_rating'] / host['count'],
+            'count': host['count']
+        }).round(2)
+        return result
+
+    def weekend_vs_weekday_pricing(self) -> Dict:
+        """Query: Weekend vs weekday pricing comparison"""
+        period = self._rollup(['period'])
+        mean = period['sum_realSum'] / period['count']
+        variance = (period['sumsq_realSum'] - period['count'] * mean ** 2) / (period['count'] - 1)
+        period_stats = pd.DataFrame({
+            'mean': mean,
+            'median': self._median(['period']),
+            'std': np.sqrt(variance.clip(lower=0)),
+            'count': period['count']
+        }).round(2)
+
+        weekend_avg = period_stats.loc['weekends', 'mean']
+        weekday_avg = period_stats.loc['weekdays', 'mean']
+        premium = ((weekend_avg - weekday_avg) / weekday_avg) * 100
+
+        return {
+            'period_stats': period_stats,
+            'weekend_avg': weekend_avg,
+            'weekday_avg': weekday_avg,
+            'premium_pct': premium
+        }
+
+    def top_products_by_sales(self, n: int = 3) -> pd.DataFrame:
+        """Query: Top N cities by listing count"""
+        result = self._rollup(['city'])['count'].rename('listing_count').reset_index()
+        result = result.sort_values('listing_count', ascending=False).head(n)
+        return result
+
+    def customer_lifetime_value(self, city: str = None) -> pd.DataFrame:
+        """Query: Highest value cities by price per person and satisfaction"""
+        totals = self.totals
+        if city is not None:
+            totals = totals[totals.index.get_level_values('city') == city]
+        grouped = totals.groupby(level='city').sum()
+
+        result = pd.DataFrame({
+            'avg_price_per_person': grouped['sum_price_per_person'] / grouped['count'],
+            'avg_satisfaction': grouped['sum_guest_satisfaction_overall'] / grouped['count'],
+            'listing_count': grouped['count']
+        }).round(2)
+        result['value_score'] = result['avg_satisfaction'] / result['avg_price_per_person']
+        result = result.sort_values('value_score', ascending=False)
+        return result
+
+    def inventory_analysis(self, threshold_days: int = 30) -> pd.DataFrame:
+        """Query: Identify cities with supply concerns"""
+        city = self._rollup(['city'])
+        city_stats = pd.DataFrame({
+            'listing_count': city['count'],
+            'avg_capacity': city['sum_person_capacity'] / city['count'],
+            'avg_bedrooms': city['sum_bedrooms'] / city['count']
+        }).round(2)
+        city_stats['supply_risk'] = city_stats['listing_count'] < city_stats['listing_count'].quantile(0.25)
+
+        return city_stats.sort_values('listing_count')
+
+    def revenue_by_country_year_month(self, city: str) -> pd.DataFrame:
+        """Query: Revenue breakdown by city and period"""
+        totals = self.totals[self.totals.index.get_level_values('city') == city]
+        grouped = totals.groupby(level=['city', 'period']).sum()
+        result = pd.DataFrame({
+            'total_revenue': grouped['sum_realSum'],
+            'avg_price': grouped['sum_realSum'] / grouped['count'],
+            'listing_count': grouped['count']
+        }).round(2)
+        return result.reset_index()
+
+    def correlation_analysis(self, columns: List[str] = None) -> pd.DataFrame:
+        """Query: Correlation matrix for numeric columns"""
+        if columns is None:
+            columns = CORR_COLUMNS
+
+        available_cols = [col for col in columns if col in self.comoments.columns and col != '_n']
+        n = self.comoments.loc['_n', '_n']
+        means = self.comoments.loc['_n', available_cols].to_numpy() / n
+        covariance = self.comoments.loc[available_cols, available_cols].to_numpy() / n - np.outer(means, means)
+        std = np.sqrt(np.diag(covariance))
+        return pd.DataFrame(covariance / np.outer(std, std), index=available_cols, columns=available_cols)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _rollup(self, keys: List[str]) -> pd.DataFrame:
+        """Sum the grain-level totals up to the given keys"""
+        rolled = self.totals.groupby(level=keys).sum()
+        rolled['count'] = rolled['count'].astype(np.int64)
+        return rolled
+
+    def _median(self, keys: List[str]) -> pd.Series:
+        """
+        Approximate median of realSum per group from the merged sketch
+
+        Mirrors pandas' median for even counts by averaging the two middle ranks.
+        """
+        hist = self.sketch['count'].groupby(level=keys + ['bucket']).sum().reset_index()
+        grouped_counts = hist.groupby(keys)['count']
+        hist['cum'] = grouped_counts.cumsum()
+        total = grouped_counts.transform('sum')
+        hist['value'] = self._bucket_value(hist['bucket'].to_numpy())
+
+        group_index = hist.groupby(keys).ngroup()
+        lower = hist[hist['cum'] > (total - 1) // 2].groupby(group_index)['value'].first()
+        upper = hist[hist['cum'] > total // 2].groupby(group_index)['value'].first()
+
+        index = grouped_counts.size().index
+        return pd.Series(((lower + upper) / 2).to_numpy(), index=index)
+
+    @staticmethod
+    def _bucket_index(values: np.ndarray) -> np.ndarray:
+        """Map prices onto log-spaced bucket indices"""
+        positive = values > 0
+        buckets = np.full(len(values), _ZERO_BUCKET, dtype=np.int32)
+        buckets[positive] = np.ceil(np.log(values[positive]) / _LOG_GAMMA).astype(np.int32)
+        return buckets
+
+    @staticmethod
+    def _bucket_value(buckets: np.ndarray) -> np.ndarray:
+        """Representative price of each bucket (within RELATIVE_ACCURACY of its members)"""
+        buckets = buckets.astype(np.int64)
+        values = 2 * np.power(_GAMMA, buckets.clip(min=-10000).astype(float)) / (_GAMMA + 1)
+        return np.where(buckets == _ZERO_BUCKET, 0.0, values)
@@ -210,6 +210,284 @@ class AirbnbAnalytics:
         available_cols = [col for col in columns if col in self.df.columns]
         return self.df[available_cols].corr()
 
+    def run_queries(self, queries: List) -> List:
+        """
+        Answer a batch of queries in one fused scan of the data
+        
+        Args:
+            queries: Query method names, or (name, kwargs) tuples,
+                     e.g. ['inventory_analysis', ('top_n_cities_by_price', {'n': 5})]
+        
+        Returns:
+            Results in query order, identical to calling each method
+        """
+        return FusedQueryExecutor(self.df).run(queries)
+
+
+# Group keys and measures each fusable query needs; other queries fall back
+# to the regular AirbnbAnalytics method
+FUSED_QUERIES = {
+    'top_n_cities_by_price': {'keys': ['city'], 'measures': ['realSum'], 'median': True},
+    'superhost_performance_analysis': {
+        'keys': ['host_is_superhost'],
+        'measures': ['realSum', 'guest_satisfaction_overall', 'cleanliness_rating'],
+        'median': True
+    },
+    'weekend_vs_weekday_pricing': {'keys': ['period'], 'measures': ['realSum'], 'median': True},
+    'top_products_by_sales': {'keys': ['city'], 'measures': [], 'median': False},
+    'customer_lifetime_value': {
+        'keys': ['city'],
+        'measures': ['realSum', 'price_per_person', 'guest_satisfaction_overall'],
+        'median': False
+    },
+    'inventory_analysis': {
+        'keys': ['city'],
+        'measures': ['realSum', 'person_capacity', 'bedrooms'],
+        'median': False
+    },
+    'revenue_by_country_year_month': {'keys': ['city', 'period'], 'measures': ['realSum'], 'median': False},
+    'market_segmentation_analysis': {
+        'keys': ['city', 'price_segment'],
+        'measures': ['realSum', 'guest_satisfaction_overall', 'location_score'],
+        'median': False
+    }
+}
+
+
+class FusedQueryExecutor:
+    """Plan and run a batch of AirbnbAnalytics queries as a single scan"""
+    
+    def __init__(self, df: pd.DataFrame):
+        """
+        Initialize executor
+        
+        Args:
+            df: Processed Airbnb DataFrame
+        """
+        self.df = df
+    
+    def run(self, queries: List) -> List:
+        """
+        Run a batch of queries
+        
+        Args:
+            queries: Query method names, or (name, kwargs) tuples
+        
+        Returns:
+            Results in query order
+        """
+        specs = [(query, {}) if isinstance(query, str) else (query[0], dict(query[1]))
+                 for query in queries]
+        fused = [name for name, _ in specs if name in FUSED_QUERIES]
+        
+        # Plan: union of group keys and measures, and the grains needing medians
+        keys = sorted({key for name in fused for key in FUSED_QUERIES[name]['keys']})
+        measures = sorted({m for name in fused for m in FUSED_QUERIES[name]['measures']})
+        if any(name == 'weekend_vs_weekday_pricing' for name in fused):
+            measures.append('realSum_sq')
+        median_grains = {tuple(FUSED_QUERIES[name]['keys']) for name in fused
+                         if FUSED_QUERIES[name]['median']}
+        
+        if fused:
+            self._scan(keys, measures, median_grains)
+        
+        fallback = AirbnbAnalytics(self.df)
+        results = []
+        for name, kwargs in specs:
+            if name in FUSED_QUERIES:
+                grouped = self._rollup(FUSED_QUERIES[name]['keys'])
+                results.append(getattr(self, f"_finish_{name}")(grouped, **kwargs))
+            else:
+                results.append(getattr(fallback, name)(**kwargs))
+        return results
+    
+    def _scan(self, keys: List[str], measures: List[str], median_grains):
+        """Factorize the keys once and reduce every measure at the finest grain"""
+        self._levels = {}
+        self._codes = {}
+        for key in keys:
+            column = self.df[key]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                codes = column.array.codes.astype(np.int64)
+                levels = pd.CategoricalIndex(column.cat.categories, dtype=column.dtype, name=key)
+            else:
+                codes, uniques = pd.factorize(column, sort=True)
+                levels = pd.Index(uniques, name=key)
+            # Missing keys get their own trailing code, dropped at roll-up
+            self._codes[key] = np.where(codes < 0, len(levels), codes)
+            self._levels[key] = levels
+        
+        self._keys = keys
+        self._dims = tuple(len(self._levels[key]) + 1 for key in keys)
+        group_ids = self._group_ids(keys)
+        n_groups = int(np.prod(self._dims))
+        
+        self._fine = {'count': np.bincount(group_ids, minlength=n_groups)}
+        for measure in measures:
+            column = 'realSum' if measure == 'realSum_sq' else measure
+            values = self.df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            weights = np.where(valid, values, 0.0)
+            if measure == 'realSum_sq':
+                weights = weights ** 2
+            else:
+                self._fine[f"n_{measure}"] = np.bincount(group_ids, weights=valid, minlength=n_groups)
+            self._fine[f"sum_{measure}"] = np.bincount(group_ids, weights=weights, minlength=n_groups)
+        
+        # One value sort shared by every median grain; each grain then needs
+        # only a stable (radix) sort of its integer group ids
+        if median_grains:
+            prices = self.df['realSum'].to_numpy(dtype=float)
+            self._price_rows = np.flatnonzero(~np.isnan(prices))
+            self._price_rows = self._price_rows[np.argsort(prices[self._price_rows], kind='stable')]
+            self._sorted_prices = prices[self._price_rows]
+        self._medians = {grain: self._grouped_median(list(grain)) for grain in median_grains}
+    
+    def _group_ids(self, keys: List[str]) -> np.ndarray:
+        """Row-level group id over the given keys"""
+        if not keys:
+            return np.zeros(len(self.df), dtype=np.int64)
+        dims = tuple(len(self._levels[key]) + 1 for key in keys)
+        return np.ravel_multi_index([self._codes[key] for key in keys], dims)
+    
+    def _grouped_median(self, keys: List[str]) -> np.ndarray:
+        """Exact realSum median per group, mirroring pandas for even counts"""
+        dims = tuple(len(self._levels[key]) + 1 for key in keys)
+        group_ids = self._group_ids(keys)[self._price_rows]
+        order = np.argsort(group_ids, kind='stable')
+        sorted_values = self._sorted_prices[order]
+        
+        counts = np.bincount(group_ids, minlength=int(np.prod(dims)))
+        if len(sorted_values) == 0:
+            return np.full(len(counts), np.nan)
+        starts = np.cumsum(counts) - counts
+        last = len(sorted_values) - 1
+        lower = np.minimum(starts + (counts - 1) // 2, last)
+        upper = np.minimum(starts + counts // 2, last)
+        medians = (sorted_values[lower] + sorted_values[upper]) / 2
+        return np.where(counts > 0, medians, np.nan)
+    
+    def _rollup(self, keys: List[str]) -> pd.DataFrame:
+        """Sum the fine-grain reductions up to the query keys"""
+        fine_codes = np.unravel_index(np.arange(len(self._fine['count'])), self._dims)
+        fine_codes = dict(zip(self._keys, fine_codes))
+        dims = tuple(len(self._levels[key]) + 1 for key in keys)
+        target = np.ravel_multi_index([fine_codes[key] for key in keys], dims)
+        n_groups = int(np.prod(dims))
+        
+        rolled = {name: np.bincount(target, weights=values, minlength=n_groups)
+                  for name, values in self._fine.items()}
+        if tuple(keys) in self._medians:
+            rolled['median_realSum'] = self._medians[tuple(keys)]
+        
+        # Keep observed groups whose keys are all present, in sorted key order
+        group_codes = np.unravel_index(np.arange(n_groups), dims)
+        keep = rolled['count'] > 0
+        for key, codes in zip(keys, group_codes):
+            keep &= codes < len(self._levels[key])
+        
+        labels = [self._levels[key][codes[keep]] for key, codes in zip(keys, group_codes)]
+        index = labels[0] if len(keys) == 1 else pd.MultiIndex.from_arrays(labels)
+        result = pd.DataFrame({name: values[keep] for name, values in rolled.items()}, index=index)
+        for name in result.columns:
+            if name == 'count' or name.startswith('n_'):
+                result[name] = result[name].astype(np.int64)
+        return result
+    
+    @staticmethod
+    def _mean(grouped: pd.DataFrame, measure: str) -> pd.Series:
+        """Mean of a measure over its non-missing values"""
+        return grouped[f"sum_{measure}"] / grouped[f"n_{measure}"]
+    
+    def _finish_top_n_cities_by_price(self, grouped: pd.DataFrame, n: int = 5) -> pd.DataFrame:
+        """Query: Top N cities by average price, from city groups"""
+        result = pd.DataFrame({
+            'avg_price': self._mean(grouped, 'realSum'),
+            'median_price': grouped['median_realSum'],
+            'listing_count': grouped['n_realSum']
+        }).reset_index()
+        return result.sort_values('avg_price', ascending=False).head(n)
+    
+    def _finish_superhost_performance_analysis(self, grouped: pd.DataFrame) -> pd.DataFrame:
+        """Query: Superhost vs regular host performance, from host groups"""
+        return pd.DataFrame({
+            'avg_price': self._mean(grouped, 'realSum'),
+            'median_price': grouped['median_realSum'],
+            'avg_satisfaction': self._mean(grouped, 'guest_satisfaction_overall'),
+            'avg_cleanliness': self._mean(grouped, 'cleanliness_rating'),
+            'count': grouped['count']
+        }).round(2)
+    
+    def _finish_weekend_vs_weekday_pricing(self, grouped: pd.DataFrame) -> Dict:
+        """Query: Weekend vs weekday pricing comparison, from period groups"""
+        n = grouped['n_realSum']
+        mean = grouped['sum_realSum'] / n
+        variance = (grouped['sum_realSum_sq'] - n * mean ** 2) / (n - 1)
+        period_stats = pd.DataFrame({
+            'mean': mean,
+            'median': grouped['median_realSum'],
+            'std': np.sqrt(variance.clip(lower=0)),
+            'count': n
+        }).round(2)
+        
+        weekend_avg = period_stats.loc['weekends', 'mean']
+        weekday_avg = period_stats.loc['weekdays', 'mean']
+        premium = ((weekend_avg - weekday_avg) / weekday_avg) * 100
+        
+        return {
+            'period_stats': period_stats,
+            'weekend_avg': weekend_avg,
+            'weekday_avg': weekday_avg,
+            'premium_pct': premium
+        }
+    
+    def _finish_top_products_by_sales(self, grouped: pd.DataFrame, n: int = 3) -> pd.DataFrame:
+        """Query: Top N cities by listing count, from city groups"""
+        result = grouped['count'].rename('listing_count').reset_index()
+        return result.sort_values('listing_count', ascending=False).head(n)
+    
+    def _finish_customer_lifetime_value(self, grouped: pd.DataFrame, city: str = None) -> pd.DataFrame:
+        """Query: Highest value cities by price per person and satisfaction, from city groups"""
+        if city is not None:
+            grouped = grouped[grouped.index == city]
+        result = pd.DataFrame({
+            'avg_price_per_person': self._mean(grouped, 'price_per_person'),
+            'avg_satisfaction': self._mean(grouped, 'guest_satisfaction_overall'),
+            'listing_count': grouped['n_realSum']
+        }).round(2)
+        result['value_score'] = result['avg_satisfaction'] / result['avg_price_per_person']
+        return result.sort_values('value_score', ascending=False)
+    
+    def _finish_inventory_analysis(self, grouped: pd.DataFrame, threshold_days: int = 30) -> pd.DataFrame:
+        """Query: Identify cities with supply concerns, from city groups"""
+        city_stats = pd.DataFrame({
+            'listing_count': grouped['n_realSum'],
+            'avg_capacity': self._mean(grouped, 'person_capacity'),
+            'avg_bedrooms': self._mean(grouped, 'bedrooms')
+        }).round(2)
+        city_stats['supply_risk'] = city_stats['listing_count'] < city_stats['listing_count'].quantile(0.25)
+        return city_stats.sort_values('listing_count')
+    
+    def _finish_revenue_by_country_year_month(self, grouped: pd.DataFrame, city: str) -> pd.DataFrame:
+        """Query: Revenue breakdown by city and period, from city x period groups"""
+        grouped = grouped[grouped.index.get_level_values('city') == city]
+        result = pd.DataFrame({
+            'total_revenue': grouped['sum_realSum'],
+            'avg_price': self._mean(grouped, 'realSum'),
+            'listing_count': grouped['n_realSum']
+        }).round(2)
+        return result.reset_index()
+    
+    def _finish_market_segmentation_analysis(self, grouped: pd.DataFrame) -> pd.DataFrame:
+        """Query: Market segmentation by price segment and city, from city x segment groups"""
+        result = pd.DataFrame({
+            'listing_count': grouped['n_realSum'],
+            'avg_price': self._mean(grouped, 'realSum'),
+            'avg_satisfaction': self._mean(grouped, 'guest_satisfaction_overall'),
+            'avg_location_score': self._mean(grouped, 'location_score')
+        }).round(2)
+        return result.reset_index()
+
 
 if __name__ == "__main__":
     # Example usage
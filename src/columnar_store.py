@@ -0,0 +1,204 @@
+"""
+Memory-Mapped Columnar Store for Processed Airbnb Data
+Business Intelligence Engineer - Storage Module
+
+On-disk layout (one directory per dataset):
+
+    header.json        format version, row count and per-column metadata
+    col_000.bin ...    one fixed-width little-endian binary file per column
+
+String and categorical columns are dictionary-encoded: the .bin file holds
+integer codes (-1 for missing) and the dictionary lives in the header.
+Readers open every column with numpy.memmap and wrap the buffers in a
+DataFrame without copying, so processes on the same host share one
+page-cached copy of the data.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnarStore:
+    """Read and write processed listings as memory-mapped column files"""
+
+    HEADER_FILE = 'header.json'
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str):
+        """
+        Initialize store
+
+        Args:
+            path: Directory holding the header and column files
+        """
+        self.path = Path(path)
+
+    def write(self, df: pd.DataFrame):
+        """
+        Write DataFrame to the store, replacing any previous contents
+
+        Args:
+            df: Processed DataFrame
+        """
+        logger.info(f"Writing columnar store to {self.path}...")
+        self.path.mkdir(parents=True, exist_ok=True)
+        for stale_file in self.path.glob('col_*.bin'):
+            stale_file.unlink()
+
+        columns = []
+        for i, name in enumerate(df.columns):
+            file_name = f"col_{i:03d}.bin"
+            values, meta = self._encode_column(df[name])
+            values.tofile(self.path / file_name)
+            meta.update({'name': str(name), 'file': file_name})
+            columns.append(meta)
+
+        header = {
+            'version': self.FORMAT_VERSION,
+            'n_rows': len(df),
+            'columns': columns
+        }
+        with open(self.path / self.HEADER_FILE, 'w') as f:
+            json.dump(header, f, indent=2)
+        logger.info(f"Columnar store written. Shape: {df.shape}")
+
+    def read(self) -> pd.DataFrame:
+        """
+        Open the store as a DataFrame backed by read-only memory maps
+
+        Returns:
+            DataFrame whose column buffers are views of the mapped files
+        """
+        header = self.read_header()
+        n_rows = header['n_rows']
+
+        data = {}
+        for meta in header['columns']:
+            values = self._map_column(self.path / meta['file'], meta['dtype'], n_rows)
+            if meta['encoding'] == 'dictionary':
+                values = pd.Categorical.from_codes(
+                    values, categories=meta['categories'], ordered=meta['ordered']
+                )
+            data[meta['name']] = values
+
+        return pd.DataFrame(data, copy=False)
+
+    def read_header(self) -> Dict:
+        """
+        Read and validate the store header
+
+        Returns:
+            Header dictionary
+        """
+        header_path = self.path / self.HEADER_FILE
+        if not header_path.exists():
+            raise FileNotFoundError(f"No columnar store found at {self.path}")
+
+        with open(header_path) as f:
+            header = json.load(f)
+
+        if header.get('version') != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported columnar store version: {header.get('version')}")
+        return header
+
+    @staticmethod
+    def _map_column(file_path: Path, dtype: str, n_rows: int) -> np.ndarray:
+        """Memory-map one column file (mmap cannot map empty files)"""
+        if n_rows == 0:
+            return np.empty(0, dtype=dtype)
+        # Plain ndarray view; the memmap stays alive as its base
+        return np.asarray(np.memmap(file_path, dtype=dtype, mode='r', shape=(n_rows,)))
+
+    @staticmethod
+    def _encode_column(series: pd.Series):
+        """
+        Encode a column as a fixed-width little-endian array
+
+        Returns:
+            Tuple of (array to write, column metadata)
+        """
+        dtype = series.dtype
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            categories = dtype.categories.tolist()
+            codes = series.array.codes
+            ordered = bool(dtype.ordered)
+        elif pd.api.types.is_bool_dtype(dtype):
+            values = series.to_numpy(dtype=np.bool_)
+            return values, {'encoding': 'plain', 'dtype': '|b1'}
+        elif pd.api.types.is_numeric_dtype(dtype):
+            values = series.to_numpy()
+            le_dtype = values.dtype.newbyteorder('<')
+            return values.astype(le_dtype, copy=False), {'encoding': 'plain', 'dtype': le_dtype.str}
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            categories = list(uniques)
+            if not all(isinstance(value, str) for value in categories):
+                raise TypeError(f"Column '{series.name}' mixes strings with other objects")
+            ordered = False
+        else:
+            raise TypeError(f"Unsupported dtype for column '{series.name}': {dtype}")
+
+        # Use the code width pandas would pick so readers can wrap the map without a copy
+        code_dtype = ColumnarStore._code_dtype(len(categories))
+        meta = {
+            'encoding': 'dictionary',
+            'dtype': code_dtype.str,
+            'categories': categories,
+            'ordered': ordered
+        }
+        return np.asarray(codes).astype(code_dtype, copy=False), meta
+
+    @staticmethod
+    def _code_dtype(n_categories: int) -> np.dtype:
+        """Smallest signed integer type able to hold the dictionary codes"""
+        for candidate in ('<i1', '<i2', '<i4'):
+            if n_categories < np.iinfo(candidate).max:
+                return np.dtype(candidate)
+        return np.dtype('<i8')
+
+
+def write_columnar(df: pd.DataFrame, path: str):
+    """
+    Write a DataFrame to a columnar store
+
+    Args:
+        df: Processed DataFrame
+        path: Store directory
+    """
+    ColumnarStore(path).write(df)
+
+
+def read_columnar(path: str) -> pd.DataFrame:
+    """
+    Open a columnar store as a memory-mapped DataFrame
+
+    Args:
+        path: Store directory
+
+    Returns:
+        DataFrame backed by read-only memory maps
+    """
+    return ColumnarStore(path).read()
+
+
+if __name__ == "__main__":
+    # Example usage: convert the processed CSV into a columnar store
+    logging.basicConfig(level=logging.INFO)
+    try:
+        project_dir = Path(__file__).parent.parent
+        df = pd.read_csv(project_dir / 'processed_airbnb_data.csv')
+        write_columnar(df, str(project_dir / 'processed_airbnb_data.columnar'))
+
+        mapped = read_columnar(str(project_dir / 'processed_airbnb_data.columnar'))
+        print(f"Opened columnar store: {mapped.shape[0]} rows, {mapped.shape[1]} columns")
+
+    except FileNotFoundError:
+        print("Processed data file not found. Please run ETL pipeline first.")
@@ -0,0 +1,152 @@
+"""
+Sharded Coordinator/Worker Execution for Airbnb ETL and Analytics
+Business Intelligence Engineer - Distributed Execution Module
+
+The unit of work is a city. The coordinator splits the city list into
+shards, a transport runs extract + transform + partial aggregation for each
+shard on a worker, and the coordinator merges the returned
+PartialAggregates into final query answers. Transports are pluggable;
+InlineTransport runs shards in-process and ProcessPoolTransport runs them
+on local worker processes.
+
+Shards are transformed independently, so transform steps that depend on the
+whole dataset (median fill values, price_segment cut points) use
+shard-local statistics. price_segment is not aggregated, but missing values
+are filled with shard-local medians: when the data has missing values, the
+merged sums, means and correlations of the filled columns depend on how
+cities are sharded and can differ slightly from a single-pipeline run.
+"""
+
+import logging
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.etl_pipeline import AirbnbETLPipeline, CITIES, PERIODS
+from src.aggregates import PartialAggregates
+
+logger = logging.getLogger(__name__)
+
+
+def run_shard(task: Dict) -> PartialAggregates:
+    """
+    Worker entry point: extract, transform and aggregate one shard
+
+    Args:
+        task: Dictionary with 'data_dir', 'cities' and 'periods'
+
+    Returns:
+        Partial aggregates for the shard (empty if it has no data files)
+    """
+    pipeline = AirbnbETLPipeline(task['data_dir'], task['cities'], task['periods'])
+    data_files = [pipeline.data_dir / f"{city}_{period}.csv"
+                  for city in task['cities'] for period in task['periods']]
+    if not any(path.exists() for path in data_files):
+        logger.warning(f"No data found for shard {task['cities']}")
+        return PartialAggregates.empty()
+
+    # Any other failure (unreadable files, transform errors) reaches the coordinator
+    processed_df = pipeline.run_pipeline()
+    return PartialAggregates.from_frame(processed_df)
+
+
+class InlineTransport:
+    """Run shard tasks sequentially in the calling process"""
+
+    n_workers = 1
+
+    def map(self, fn: Callable, tasks: List[Dict]) -> List:
+        """Apply fn to every task, preserving order"""
+        return [fn(task) for task in tasks]
+
+
+class ProcessPoolTransport:
+    """Run shard tasks on a pool of local worker processes"""
+
+    def __init__(self, n_workers: int = 4):
+        """
+        Initialize transport
+
+        Args:
+            n_workers: Number of worker processes
+        """
+        self.n_workers = n_workers
+
+    def map(self, fn: Callable, tasks: List[Dict]) -> List:
+        """Apply fn to every task on the pool, preserving order"""
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            return list(executor.map(fn, tasks))
+
+
+class ShardCoordinator:
+    """Split cities into shards, dispatch them and merge the partial results"""
+
+    def __init__(self, data_dir: str, cities: List[str], periods: List[str],
+                 transport=None, n_shards: Optional[int] = None):
+        """
+        Initialize coordinator
+
+        Args:
+            data_dir: Directory containing CSV files
+            cities: List of city names
+            periods: List of time periods (weekdays, weekends)
+            transport: Object with map(fn, tasks) (default: InlineTransport)
+            n_shards: Number of shards (default: one per transport worker)
+        """
+        self.data_dir = str(data_dir)
+        self.cities = cities
+        self.periods = periods
+        self.transport = transport if transport is not None else InlineTransport()
+        self.n_shards = n_shards or self.transport.n_workers
+
+    def make_shards(self) -> List[List[str]]:
+        """
+        Split cities round-robin into at most n_shards non-empty shards
+
+        Returns:
+            List of city lists
+        """
+        n_shards = max(1, min(self.n_shards, len(self.cities)))
+        return [self.cities[i::n_shards] for i in range(n_shards)]
+
+    def run(self) -> PartialAggregates:
+        """
+        Run all shards and merge their partial aggregates
+
+        Returns:
+            Merged partial aggregates covering every city
+        """
+        shards = self.make_shards()
+        logger.info(f"Dispatching {len(self.cities)} cities as {len(shards)} shards...")
+        tasks = [
+            {'data_dir': self.data_dir, 'cities': shard, 'periods': self.periods}
+            for shard in shards
+        ]
+        parts = self.transport.map(run_shard, tasks)
+
+        merged = PartialAggregates.combine(parts)
+        if merged.record_count == 0:
+            raise ValueError("No data files found!")
+        logger.info(f"Merged {len(parts)} shards. Total records: {merged.record_count}")
+        return merged
+
+
+if __name__ == "__main__":
+    # Example usage
+    data_dir = Path(__file__).parent.parent / 'data'
+
+    coordinator = ShardCoordinator(str(data_dir), CITIES, PERIODS,
+                                   transport=ProcessPoolTransport(n_workers=4))
+    analytics = coordinator.run()
+
+    print("=== Top 5 Cities by Price ===")
+    print(analytics.top_n_cities_by_price(5))
+
+    print("\n=== Weekend vs Weekday Pricing ===")
+    result = analytics.weekend_vs_weekday_pricing()
+    print(result['period_stats'])
+    print(f"Weekend Premium: {result['premium_pct']:.2f}%")
@@ -12,11 +12,18 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+CITIES = ['amsterdam', 'athens', 'barcelona', 'berlin', 'budapest',
+          'lisbon', 'london', 'paris', 'rome', 'vienna']
+PERIODS = ['weekdays', 'weekends']
+
 
 class AirbnbETLPipeline:
     """ETL Pipeline for processing Airbnb listing data"""
     
-    def __init__(self, data_dir: str, cities: List[str], periods: List[str]):
+    PEER_GROUP_KEYS = ['city', 'room_type', 'period']
+    
+    def __init__(self, data_dir: str, cities: List[str], periods: List[str],
+                 peer_group_ranks: bool = False, peer_price_segment: bool = False):
         """
         Initialize ETL Pipeline
         
@@ -24,12 +31,20 @@ class AirbnbETLPipeline:
             data_dir: Directory containing CSV files
             cities: List of city names
             periods: List of time periods (weekdays, weekends)
+            peer_group_ranks: Add per-listing percentile ranks within
+                city x room_type x period peer groups during transform
+            peer_price_segment: With peer_group_ranks, also add the per-group
+                price tercile as 'peer_price_segment'
         """
         self.data_dir = Path(data_dir)
         self.cities = cities
         self.periods = periods
+        self.peer_group_ranks = peer_group_ranks
+        self.peer_price_segment = peer_price_segment
         self.raw_data = None
         self.processed_data = None
+        self.fill_values = {}
+        self.segment_bins = None
         
     def extract(self) -> pd.DataFrame:
         """
@@ -75,6 +90,150 @@ class AirbnbETLPipeline:
             Cleaned and transformed DataFrame
         """
         logger.info("Starting data transformation...")
+        
+        # Dataset-wide statistics, reused by transform_batch for appended rows
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.drop('Unnamed: 0', errors='ignore')
+        self.fill_values = df[numeric_cols].median().to_dict()
+        self.segment_bins = self.derive_segment_bins(df['realSum'].fillna(self.fill_values['realSum']))
+        
+        df_clean = self._transform_rows(df, self.segment_bins, log_fills=True)
+        
+        if self.peer_group_ranks:
+            df_clean = self.rank_within_peer_groups(df_clean, add_segment=self.peer_price_segment)
+        
+        self.processed_data = df_clean
+        logger.info(f"Transformation complete. Processed {len(df_clean)} records")
+        return df_clean
+    
+    def transform_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Transform new rows using the statistics of the last full transform
+        
+        Only row-local work is done: missing values are filled with the
+        stored medians and price_segment uses the stored cut points, so the
+        cost is proportional to the batch size. Peer-group ranks depend on
+        the whole group and are not computed for batch rows.
+        
+        Args:
+            df: Raw DataFrame of new listings (with 'city' and 'period')
+            
+        Returns:
+            Cleaned and transformed DataFrame
+        """
+        if self.segment_bins is None:
+            raise ValueError("transform() must run before transform_batch()")
+        
+        # Open the top edge so prices above the previous maximum stay Premium
+        bins = self.segment_bins[:-1] + [np.inf]
+        return self._transform_rows(df, bins)
+    
+    @staticmethod
+    def derive_segment_bins(prices: pd.Series) -> List[float]:
+        """
+        Compute price_segment cut points (33rd/67th percentile of realSum)
+        
+        Args:
+            prices: realSum values
+            
+        Returns:
+            Bin edges for pd.cut
+        """
+        return [0, prices.quantile(0.33), prices.quantile(0.67), prices.max()]
+    
+    def rank_within_peer_groups(self, df: pd.DataFrame, add_segment: bool = False) -> pd.DataFrame:
+        """
+        Percentile rank of price and price per person within peer groups
+        
+        Peer groups are city x room_type x period. Ranks match
+        groupby(...).rank(pct=True) (ties averaged), but are computed with
+        one lexsort over (group code, value) and per-group offsets -
+        O(N log N) with no per-group Python loop. Categorical keys reuse
+        their existing codes.
+        
+        Args:
+            df: Transformed DataFrame
+            add_segment: Also add 'peer_price_segment' (per-group terciles)
+            
+        Returns:
+            DataFrame with 'price_pct_rank' and 'price_per_person_pct_rank' columns
+        """
+        # Shallow copy: only new columns are added, existing ones are shared
+        df_ranked = df.copy(deep=False)
+        rank_columns = [('realSum', 'price_pct_rank'),
+                        ('price_per_person', 'price_per_person_pct_rank')]
+        
+        if len(df) == 0:
+            for _, rank_column in rank_columns:
+                df_ranked[rank_column] = np.nan
+            if add_segment:
+                df_ranked['peer_price_segment'] = pd.Categorical(
+                    [], categories=['Budget', 'Mid-range', 'Premium'], ordered=True)
+            return df_ranked
+        
+        # Combined group code over the key columns (-1 marks a missing key)
+        codes = [self._group_codes(df[key]) for key in self.PEER_GROUP_KEYS]
+        dims = [max(c.max(), 0) + 1 for c in codes]
+        missing_key = np.any([c < 0 for c in codes], axis=0)
+        # Narrowest integer type keeps the group key of the lexsort cheap
+        group_ids = np.ravel_multi_index([c.clip(min=0) for c in codes], dims).astype(
+            np.min_scalar_type(np.prod(dims) - 1))
+        
+        for column, rank_column in rank_columns:
+            values = df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values) & ~missing_key
+            ranks = np.full(len(df), np.nan)
+            ranks[valid] = self._grouped_pct_rank(group_ids[valid], values[valid])
+            df_ranked[rank_column] = ranks
+        
+        if add_segment:
+            df_ranked['peer_price_segment'] = pd.cut(
+                df_ranked['price_pct_rank'],
+                bins=[0, 0.33, 0.67, 1],
+                labels=['Budget', 'Mid-range', 'Premium']
+            )
+        
+        n_groups = np.count_nonzero(np.bincount(group_ids[~missing_key]))
+        logger.info(f"Ranked {len(df)} records within {n_groups} peer groups")
+        return df_ranked
+    
+    @staticmethod
+    def _group_codes(column: pd.Series) -> np.ndarray:
+        """Integer codes of a key column (categorical codes are reused as is)"""
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            return np.asarray(column.array.codes)
+        return pd.factorize(column)[0]
+    
+    @staticmethod
+    def _grouped_pct_rank(group_ids: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Average-tie percentile rank of values within their group"""
+        n = len(values)
+        if n == 0:
+            return np.empty(0)
+        
+        # Rows grouped, values ascending within each group
+        order = np.lexsort((values, group_ids))
+        sorted_groups = group_ids[order]
+        sorted_values = values[order]
+        
+        counts = np.bincount(sorted_groups)
+        starts = np.cumsum(counts) - counts
+        position = np.arange(n) - starts[sorted_groups]
+        
+        # Runs of equal values within a group share their average position
+        new_run = np.r_[True, (sorted_groups[1:] != sorted_groups[:-1])
+                        | (sorted_values[1:] != sorted_values[:-1])]
+        run_id = np.cumsum(new_run) - 1
+        run_start = np.flatnonzero(new_run)
+        run_end = np.r_[run_start[1:], n] - 1
+        average_position = (position[run_start] + position[run_end]) / 2
+        
+        ranks = np.empty(n)
+        ranks[order] = (average_position[run_id] + 1) / counts[sorted_groups]
+        return ranks
+    
+    def _transform_rows(self, df: pd.DataFrame, segment_bins: List[float],
+                        log_fills: bool = False) -> pd.DataFrame:
+        """Apply cleaning and feature engineering row by row"""
         df_clean = df.copy()
         
         # Remove unnamed index column
@@ -84,10 +243,12 @@ class AirbnbETLPipeline:
         # Handle missing values
         numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
         for col in numeric_cols:
-            if df_clean[col].isnull().sum() > 0:
-                fill_value = df_clean[col].median()
-                df_clean[col].fillna(fill_value, inplace=True)
-                logger.info(f"Filled {df_clean[col].isnull().sum()} missing values in {col} with median: {fill_value}")
+            missing = df_clean[col].isnull().sum()
+            if missing > 0 and col in self.fill_values:
+                fill_value = self.fill_values[col]
+                df_clean[col] = df_clean[col].fillna(fill_value)
+                if log_fills:
+                    logger.info(f"Filled {missing} missing values in {col} with median: {fill_value}")
         
         # Ensure boolean columns are properly formatted
         bool_cols = ['room_shared', 'room_private', 'host_is_superhost', 'multi', 'biz']
@@ -102,8 +263,7 @@ class AirbnbETLPipeline:
         # Price segmentation
         df_clean['price_segment'] = pd.cut(
             df_clean['realSum'],
-            bins=[0, df_clean['realSum'].quantile(0.33), 
-                  df_clean['realSum'].quantile(0.67), df_clean['realSum'].max()],
+            bins=segment_bins,
             labels=['Budget', 'Mid-range', 'Premium']
         )
         
@@ -114,8 +274,6 @@ class AirbnbETLPipeline:
             labels=['Low', 'Medium', 'High']
         )
         
-        self.processed_data = df_clean
-        logger.info(f"Transformation complete. Processed {len(df_clean)} records")
         return df_clean
     
     def load(self, df: pd.DataFrame, output_path: str = 'processed_airbnb_data.csv'):
@@ -177,9 +335,6 @@ class AirbnbETLPipeline:
 if __name__ == "__main__":
     # Example usage
     from pathlib import Path
-    CITIES = ['amsterdam', 'athens', 'barcelona', 'berlin', 'budapest',
-              'lisbon', 'london', 'paris', 'rome', 'vienna']
-    PERIODS = ['weekdays', 'weekends']
     
     # Get data directory (parent directory / data)
     data_dir = Path(__file__).parent.parent / 'data'
@@ -0,0 +1,203 @@
+"""
+Asynchronous Artifact Writer for Analysis Outputs
+Business Intelligence Engineer - Output Module
+
+Artifacts (CSV tables, rendered PNGs, columnar stores) are queued to a
+background thread pool so the next compute stage can start while earlier
+outputs are still being flushed. Every artifact is written to a temporary
+file in the destination directory and renamed into place, so readers never
+see a partial file. wait() is the final barrier and returns per-artifact
+byte counts and latencies.
+"""
+
+import logging
+import os
+import shutil
+import sys
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.columnar_store import ColumnarStore
+
+logger = logging.getLogger(__name__)
+
+# Compression method -> file suffix appended to CSV paths
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+class ArtifactWriter:
+    """Background writer pool with atomic writes and per-artifact stats"""
+
+    def __init__(self, max_workers: int = 4, compression: Optional[str] = None):
+        """
+        Initialize writer
+
+        Args:
+            max_workers: Number of writer threads
+            compression: Default CSV compression ('gzip', 'zstd' or None)
+        """
+        self._check_compression(compression)
+        self.compression = compression
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='artifact-writer')
+        self._futures: List[Future] = []
+        self.stats: List[Dict] = []
+
+    def submit_csv(self, df: pd.DataFrame, path: str, compression: Optional[str] = 'default',
+                   index: bool = False) -> Future:
+        """
+        Queue a DataFrame to be written as (optionally compressed) CSV
+
+        The DataFrame must not be modified until the write completes.
+
+        Args:
+            df: DataFrame to write
+            path: Output path; the compression suffix is appended if missing
+            compression: 'gzip', 'zstd', None, or 'default' for the writer default
+            index: Whether to write the index
+
+        Returns:
+            Future resolving to the final path
+        """
+        if compression == 'default':
+            compression = self.compression
+        self._check_compression(compression)
+
+        path = Path(path)
+        suffix = COMPRESSION_SUFFIXES.get(compression)
+        if suffix and path.suffix != suffix:
+            path = path.with_name(path.name + suffix)
+
+        def write(tmp_path: Path):
+            options = {'method': compression} if compression else None
+            df.to_csv(tmp_path, index=index, compression=options)
+
+        return self._submit(path, write)
+
+    def submit_bytes(self, data: bytes, path: str) -> Future:
+        """
+        Queue raw bytes (e.g. a rendered PNG) to be written
+
+        Args:
+            data: File contents
+            path: Output path
+
+        Returns:
+            Future resolving to the final path
+        """
+        return self._submit(Path(path), lambda tmp_path: tmp_path.write_bytes(data))
+
+    def submit_columnar(self, df: pd.DataFrame, path: str) -> Future:
+        """
+        Queue a DataFrame to be written as a memory-mapped columnar store
+
+        Args:
+            df: DataFrame to write
+            path: Store directory
+
+        Returns:
+            Future resolving to the final path
+        """
+        return self._submit(Path(path), lambda tmp_path: ColumnarStore(str(tmp_path)).write(df))
+
+    def wait(self) -> List[Dict]:
+        """
+        Block until every queued artifact is written
+
+        Returns:
+            Per-artifact stats: path, bytes, queue_seconds, write_seconds
+        """
+        futures, self._futures = self._futures, []
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return self.stats
+
+    def close(self):
+        """Wait for pending writes and stop the writer threads"""
+        try:
+            self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _submit(self, path: Path, write: Callable[[Path], None]) -> Future:
+        """Queue an atomic write of one artifact"""
+        queued_at = time.perf_counter()
+
+        def task() -> str:
+            started_at = time.perf_counter()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp-{uuid.uuid4().hex}")
+            try:
+                write(tmp_path)
+                n_bytes = self._size(tmp_path)
+                self._replace(tmp_path, path)
+            except Exception:
+                self._remove(tmp_path)
+                logger.error(f"Error writing {path}")
+                raise
+
+            finished_at = time.perf_counter()
+            self.stats.append({
+                'path': str(path),
+                'bytes': n_bytes,
+                'queue_seconds': started_at - queued_at,
+                'write_seconds': finished_at - started_at
+            })
+            logger.info(f"Wrote {path} ({n_bytes} bytes)")
+            return str(path)
+
+        future = self._executor.submit(task)
+        self._futures.append(future)
+        return future
+
+    @staticmethod
+    def _check_compression(compression: Optional[str]):
+        """Validate a compression method and its optional dependency"""
+        if compression is not None and compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == 'zstd':
+            try:
+                import zstandard  # noqa: F401
+            except ImportError:
+                raise ImportError("zstd compression requires the 'zstandard' package")
+
+    @staticmethod
+    def _size(path: Path) -> int:
+        """Size of a file, or total size of a directory's files"""
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+        return path.stat().st_size
+
+    @staticmethod
+    def _replace(tmp_path: Path, path: Path):
+        """Move a finished artifact into place (directories replace the old store)"""
+        if tmp_path.is_dir() and path.exists():
+            old_path = path.with_name(f".{path.name}.old-{uuid.uuid4().hex}")
+            os.replace(path, old_path)
+            os.replace(tmp_path, path)
+            shutil.rmtree(old_path, ignore_errors=True)
+        else:
+            os.replace(tmp_path, path)
+
+    @staticmethod
+    def _remove(path: Path):
+        """Remove a temporary file or directory if present"""
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
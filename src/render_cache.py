@@ -0,0 +1,126 @@
+"""
+Content-Addressed Render Cache for Dashboard Figures
+Business Intelligence Engineer - Visualization Cache Module
+
+Rendered PNGs are stored under a key hashed from the exact data a plot
+consumes, its drawing code, its render parameters (figsize, dpi, style,
+palette) and the versions of the plotting libraries. A figure is only
+redrawn when one of those changes. Only the latest render of each plot
+name is kept; writing a new one prunes the older entries.
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Union
+
+import matplotlib
+import numpy as np
+import pandas as pd
+import seaborn as sns
+
+logger = logging.getLogger(__name__)
+
+LIBRARY_VERSIONS = {
+    'matplotlib': matplotlib.__version__,
+    'seaborn': sns.__version__,
+    'pandas': pd.__version__,
+    'numpy': np.__version__
+}
+
+
+class RenderCache:
+    """PNG cache keyed by a hash of plot inputs, code and render parameters"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize cache
+
+        Args:
+            cache_dir: Directory holding cached renders
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, name: str, inputs: List, params: Dict,
+            code: Union[Callable, Sequence[Callable]] = None) -> str:
+        """
+        Compute the cache key of a render
+
+        Args:
+            name: Plot name
+            inputs: DataFrames, Series, arrays or scalars the plot consumes
+            params: Render parameters (figsize, dpi, style, palette, ...)
+            code: Drawing function (or functions), whose source is part of the key
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256()
+        header = {'name': name, 'params': params, 'versions': LIBRARY_VERSIONS}
+        digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+        for function in ([] if code is None else code if isinstance(code, (list, tuple)) else [code]):
+            digest.update(inspect.getsource(function).encode())
+        for value in inputs:
+            digest.update(self._hash_input(value))
+        return digest.hexdigest()
+
+    def get_or_render(self, name: str, inputs: List, params: Dict,
+                      render: Callable[[], bytes], code: Union[Callable, Sequence[Callable]] = None) -> bytes:
+        """
+        Return the cached PNG for a render, rendering and storing it on a miss
+
+        Storing a new render removes older renders of the same name.
+
+        Args:
+            name: Plot name
+            inputs: Data the plot consumes
+            params: Render parameters
+            render: Function that draws the plot and returns PNG bytes
+            code: Drawing function (or functions) whose source is part of the key
+
+        Returns:
+            PNG bytes
+        """
+        path = self.cache_dir / f"{name}-{self.key(name, inputs, params, code)[:32]}.png"
+        if path.exists():
+            self.hits += 1
+            return path.read_bytes()
+
+        self.misses += 1
+        png = render()
+
+        tmp_path = path.with_suffix(f".tmp-{os.getpid()}")
+        tmp_path.write_bytes(png)
+        os.replace(tmp_path, path)
+        self._prune(name, keep=path)
+        logger.info(f"Rendered and cached {name}")
+        return png
+
+    def _prune(self, name: str, keep: Path):
+        """Remove cached renders of a plot name other than keep"""
+        pattern = re.compile(rf"{re.escape(name)}-[0-9a-f]{{32}}\.png")
+        for path in self.cache_dir.iterdir():
+            if path != keep and pattern.fullmatch(path.name):
+                path.unlink(missing_ok=True)
+                logger.info(f"Pruned stale render {path.name}")
+
+    @staticmethod
+    def _hash_input(value) -> bytes:
+        """Stable digest of one plot input"""
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            hashed = pd.util.hash_pandas_object(value, index=True).to_numpy()
+            layout = value.dtypes.astype(str).to_dict() if isinstance(value, pd.DataFrame) else str(value.dtype)
+            meta = json.dumps([str(value.shape), layout], sort_keys=True, default=str)
+            return hashlib.sha256(meta.encode() + hashed.tobytes()).digest()
+        if isinstance(value, np.ndarray):
+            meta = f"{value.dtype.str}{value.shape}".encode()
+            return hashlib.sha256(meta + np.ascontiguousarray(value).tobytes()).digest()
+        return hashlib.sha256(repr(value).encode()).digest()
+
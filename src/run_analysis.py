@@ -10,19 +10,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import modules
-from src.etl_pipeline import AirbnbETLPipeline
+from src.etl_pipeline import AirbnbETLPipeline, CITIES, PERIODS
 from src.analysis_queries import AirbnbAnalytics
 from src.visualizations import AirbnbVisualizations
+from src.render_cache import RenderCache
+from src.output_writer import ArtifactWriter
 import pandas as pd
-import matplotlib.pyplot as plt
 
 def main():
     """Run complete analysis pipeline"""
     
     # Configuration
-    CITIES = ['amsterdam', 'athens', 'barcelona', 'berlin', 'budapest',
-              'lisbon', 'london', 'paris', 'rome', 'vienna']
-    PERIODS = ['weekdays', 'weekends']
     DATA_DIR = Path(__file__).parent.parent / 'data'
     
     print("=" * 60)
@@ -35,7 +33,11 @@ def main():
     print("-" * 60)
     pipeline = AirbnbETLPipeline(str(DATA_DIR), CITIES, PERIODS)
     output_dir = Path(__file__).parent.parent
-    processed_data = pipeline.run_pipeline(output_path=str(output_dir / 'processed_airbnb_data.csv'))
+    processed_data = pipeline.run_pipeline()
+    
+    # Artifacts are flushed in the background while later stages run
+    writer = ArtifactWriter()
+    writer.submit_csv(processed_data, str(output_dir / 'processed_airbnb_data.csv'))
     print()
     
     # Step 2: Analysis Queries
@@ -43,46 +45,46 @@ def main():
     print("-" * 60)
     analytics = AirbnbAnalytics(processed_data)
     
+    # Answer all queries in one fused scan
+    top_cities, period_analysis, superhost_perf = analytics.run_queries([
+        ('top_n_cities_by_price', {'n': 5}),
+        'weekend_vs_weekday_pricing',
+        'superhost_performance_analysis'
+    ])
+    
     print("\n--- Top 5 Cities by Average Price ---")
-    top_cities = analytics.top_n_cities_by_price(5)
     print(top_cities)
     
     print("\n--- Weekend vs Weekday Pricing ---")
-    period_analysis = analytics.weekend_vs_weekday_pricing()
     print(period_analysis['period_stats'])
     print(f"Weekend Premium: {period_analysis['premium_pct']:.2f}%")
     
     print("\n--- Superhost Performance ---")
-    superhost_perf = analytics.superhost_performance_analysis()
     print(superhost_perf)
     print()
     
     # Step 3: Visualizations
     print("STEP 3: Generating Visualizations...")
     print("-" * 60)
-    viz = AirbnbVisualizations(processed_data)
+    # Unchanged figures are served from the render cache instead of redrawn
+    render_cache = RenderCache(str(output_dir / '.render_cache'))
+    viz = AirbnbVisualizations(processed_data, render_cache=render_cache)
     
     # Generate individual visualizations
     print("Generating price distribution plot...")
-    viz.plot_price_distribution_by_city()
-    plt.savefig('price_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    writer.submit_bytes(viz.render_plot('price_distribution', dpi=300), 'price_distribution.png')
     
     print("Generating city supply dashboard...")
-    viz.plot_city_supply_dashboard()
-    plt.savefig('city_supply_dashboard.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    writer.submit_bytes(viz.render_plot('city_supply_dashboard', dpi=300), 'city_supply_dashboard.png')
     
     print("Generating correlation heatmap...")
-    viz.plot_correlation_heatmap()
-    plt.savefig('correlation_heatmap.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    writer.submit_bytes(viz.render_plot('correlation_heatmap', dpi=300), 'correlation_heatmap.png')
     
     print("Generating full dashboard...")
-    viz.generate_full_dashboard(save_path='full_dashboard.png')
-    plt.close()
+    writer.submit_bytes(viz.render_plot('full_dashboard', dpi=300), 'full_dashboard.png')
+    print(f"Render cache: {render_cache.hits} hits, {render_cache.misses} misses")
     
-    print("\nVisualizations saved:")
+    print("\nVisualizations queued:")
     print("  - price_distribution.png")
     print("  - city_supply_dashboard.png")
     print("  - correlation_heatmap.png")
@@ -103,8 +105,8 @@ def main():
     city_summary.columns = ['avg_price', 'median_price', 'price_std', 'listing_count',
                            'avg_satisfaction', 'superhost_pct', 'avg_capacity', 'avg_bedrooms']
     city_summary = city_summary.reset_index()
-    city_summary.to_csv('city_summary_statistics.csv', index=False)
-    print("City summary statistics exported to 'city_summary_statistics.csv'")
+    writer.submit_csv(city_summary, 'city_summary_statistics.csv')
+    print("City summary statistics queued for 'city_summary_statistics.csv'")
     print()
     
     # Step 5: Business Insights
@@ -121,6 +123,13 @@ def main():
     print(f"  City with most listings: {city_supply.index[0]} ({city_supply.iloc[0]} listings)")
     print(f"  Weekend premium: {period_analysis['premium_pct']:.2f}%")
     
+    # Barrier: every artifact is on disk before the run is reported complete
+    writer.close()
+    print("\nArtifacts written:")
+    for stat in writer.stats:
+        print(f"  - {stat['path']}: {stat['bytes']:,} bytes "
+              f"(queued {stat['queue_seconds']:.2f}s, write {stat['write_seconds']:.2f}s)")
+    
     print("\n" + "=" * 60)
     print("ANALYSIS COMPLETE!")
     print("=" * 60)
@@ -0,0 +1,278 @@
+"""
+Similar-Listing Search Index for Pricing Comps
+Business Intelligence Engineer - Similarity Search Module
+
+Listings are embedded as standardized float32 vectors (room type one-hot
+plus capacity, bedrooms, distances, location indices and ratings) and
+partitioned by city, since comps are always drawn from the same market.
+Small partitions are searched exactly with blocked NumPy distance
+computations; large partitions use an IVF index (k-means coarse clusters,
+probing the nearest n_probe lists, each list scored against all queries
+probing it in one matrix product). recall() reports the approximate
+index's recall against the exact search.
+"""
+
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_FEATURES = ['person_capacity', 'bedrooms', 'dist', 'metro_dist',
+                    'attr_index_norm', 'rest_index_norm', 'cleanliness_rating',
+                    'guest_satisfaction_overall']
+
+# Upper bound on the elements of a per-block distance matrix; query blocks
+# shrink to stay within it for large partitions and lists
+BLOCK_ELEMENTS = 1 << 22
+
+
+class _Partition:
+    """Feature matrix of one city, with an optional IVF index"""
+
+    def __init__(self, rows: np.ndarray, vectors: np.ndarray):
+        self.rows = rows
+        self.vectors = vectors
+        self.norms = np.einsum('ij,ij->i', vectors, vectors)
+        self.centroids = None
+        self.list_members = None
+        self.list_offsets = None
+
+    def build_ivf(self, n_lists: int, n_iter: int, rng: np.random.Generator):
+        """Cluster the vectors with k-means and store inverted lists"""
+        n_lists = min(n_lists, len(self.vectors))
+        centroids = self.vectors[rng.choice(len(self.vectors), n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assignment = self._nearest_centroid(centroids)
+            counts = np.bincount(assignment, minlength=n_lists)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, self.vectors)
+            filled = counts > 0
+            centroids[filled] = sums[filled] / counts[filled, None]
+            # Re-seed empty clusters from random vectors so they can gain members
+            centroids[~filled] = self.vectors[rng.choice(len(self.vectors), (~filled).sum(), replace=False)]
+
+        # Drop clusters that are still empty (e.g. duplicate vectors) so probes are not spent on them
+        assignment = self._nearest_centroid(centroids)
+        filled = np.bincount(assignment, minlength=n_lists) > 0
+        assignment = (np.cumsum(filled) - 1)[assignment]
+        self.centroids = centroids[filled]
+        self.list_members = np.argsort(assignment, kind='stable')
+        self.list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignment))])
+
+    def _nearest_centroid(self, centroids: np.ndarray) -> np.ndarray:
+        distances = -2 * self.vectors @ centroids.T + np.einsum('ij,ij->i', centroids, centroids)
+        return distances.argmin(axis=1)
+
+
+class ListingSimilarityIndex:
+    """k-nearest-neighbour search over listings, partitioned by city"""
+
+    def __init__(self, df: pd.DataFrame, exact_threshold: int = 5000, n_probe: int = 8,
+                 block_size: int = 1024, seed: int = 0):
+        """
+        Build the index from a processed DataFrame
+
+        Args:
+            df: Processed Airbnb DataFrame
+            exact_threshold: Partitions up to this size are searched exactly
+            n_probe: IVF lists scanned per query in large partitions
+            block_size: Maximum query rows per search block
+            seed: Random seed for k-means initialisation
+        """
+        self.df = df
+        self.exact_threshold = exact_threshold
+        self.n_probe = n_probe
+        self.block_size = block_size
+
+        vectors = self._feature_matrix(df)
+        self._city_codes, cities = pd.factorize(df['city'])
+        self._position = np.empty(len(df), dtype=np.int64)
+
+        rng = np.random.default_rng(seed)
+        self.partitions: Dict[str, _Partition] = {}
+        for code, city in enumerate(cities):
+            rows = np.flatnonzero(self._city_codes == code)
+            self._position[rows] = np.arange(len(rows))
+            partition = _Partition(rows, vectors[rows])
+            if len(rows) > exact_threshold:
+                partition.build_ivf(int(np.sqrt(len(rows))), n_iter=10, rng=rng)
+            self.partitions[city] = partition
+        self._cities = cities
+        logger.info(f"Built similarity index over {len(df)} listings in {len(cities)} cities")
+
+    def query(self, rows: List[int], k: int = 20, exact: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k most similar listings (same city, excluding itself) for each row
+
+        Args:
+            rows: Positional row numbers of the query listings in df
+            k: Number of neighbours
+            exact: Force exact search in every partition
+
+        Returns:
+            Tuple of (neighbour positions, squared distances), each of shape (len(rows), k);
+            missing neighbours are -1 / inf
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        neighbors = np.full((len(rows), k), -1, dtype=np.int64)
+        distances = np.full((len(rows), k), np.inf, dtype=np.float32)
+
+        query_codes = self._city_codes[rows]
+        for code in np.unique(query_codes):
+            partition = self.partitions[self._cities[code]]
+            batch = np.flatnonzero(query_codes == code)
+            local = self._position[rows[batch]]
+            if exact or partition.centroids is None:
+                found, dist = self._search_exact(partition, local, k)
+            else:
+                found, dist = self._search_ivf(partition, local, k)
+            neighbors[batch] = np.where(found >= 0, partition.rows[found.clip(min=0)], -1)
+            distances[batch] = dist
+        return neighbors, distances
+
+    def similar_listings(self, row: int, k: int = 20) -> pd.DataFrame:
+        """
+        Comps for one listing
+
+        Args:
+            row: Positional row number of the listing in df
+            k: Number of comps
+
+        Returns:
+            The k most similar listings with a 'distance' column
+        """
+        neighbors, distances = self.query([row], k)
+        found = neighbors[0] >= 0
+        comps = self.df.iloc[neighbors[0][found]].copy()
+        comps['distance'] = np.sqrt(distances[0][found])
+        return comps
+
+    def recall(self, sample_size: int = 1000, k: int = 20, seed: int = 0) -> float:
+        """
+        Recall@k of the approximate search against exact search
+
+        Args:
+            sample_size: Number of query listings sampled from approximate partitions
+            k: Number of neighbours
+
+        Returns:
+            Mean fraction of exact neighbours found (1.0 if everything is exact)
+        """
+        candidates = np.concatenate([p.rows for p in self.partitions.values() if p.centroids is not None]
+                                    + [np.empty(0, dtype=np.int64)])
+        if len(candidates) == 0:
+            return 1.0
+        rng = np.random.default_rng(seed)
+        sample = rng.choice(candidates, min(sample_size, len(candidates)), replace=False)
+
+        approx, _ = self.query(sample, k)
+        exact, _ = self.query(sample, k, exact=True)
+        hits = [len(np.intersect1d(a[a >= 0], e[e >= 0])) / max((e >= 0).sum(), 1)
+                for a, e in zip(approx, exact)]
+        return float(np.mean(hits))
+
+    def _search_exact(self, partition: _Partition, local: np.ndarray, k: int):
+        """Blocked brute-force search within one partition"""
+        n = len(partition.rows)
+        k_found = min(k, n - 1)
+        neighbors = np.full((len(local), k), -1, dtype=np.int64)
+        distances = np.full((len(local), k), np.inf, dtype=np.float32)
+        if k_found <= 0:
+            return neighbors, distances
+
+        block_size = max(1, min(self.block_size, BLOCK_ELEMENTS // n))
+        for start in range(0, len(local), block_size):
+            block = local[start:start + block_size]
+            queries = partition.vectors[block]
+            dist = partition.norms[block, None] - 2 * queries @ partition.vectors.T + partition.norms[None, :]
+            dist[np.arange(len(block)), block] = np.inf
+            top = np.argpartition(dist, k_found - 1, axis=1)[:, :k_found]
+            top_dist = np.take_along_axis(dist, top, axis=1)
+            order = np.argsort(top_dist, axis=1)
+            neighbors[start:start + len(block), :k_found] = np.take_along_axis(top, order, axis=1)
+            distances[start:start + len(block), :k_found] = np.maximum(np.take_along_axis(top_dist, order, axis=1), 0)
+        return neighbors, distances
+
+    def _search_ivf(self, partition: _Partition, local: np.ndarray, k: int):
+        """Approximate search scanning the n_probe nearest inverted lists"""
+        queries = partition.vectors[local]
+        centroid_norms = np.einsum('ij,ij->i', partition.centroids, partition.centroids)
+        centroid_dist = -2 * queries @ partition.centroids.T + centroid_norms
+        n_probe = min(self.n_probe, len(partition.centroids))
+        probes = np.argpartition(centroid_dist, n_probe - 1, axis=1)[:, :n_probe]
+
+        # (query, probe) pairs grouped by list: each probed list is scored
+        # against every query probing it in one matrix product, keeping the
+        # k best members per pair; the pairs of a query are merged at the end
+        pair_query = np.repeat(np.arange(len(local)), n_probe)
+        pair_list = probes.ravel()
+        by_list = np.argsort(pair_list, kind='stable')
+        pair_offsets = np.searchsorted(pair_list[by_list], np.arange(len(partition.centroids) + 1))
+
+        pair_neighbors = np.full((len(pair_list), k), -1, dtype=np.int64)
+        pair_distances = np.full((len(pair_list), k), np.inf, dtype=np.float32)
+        offsets = partition.list_offsets
+        for list_id in np.unique(pair_list):
+            members = partition.list_members[offsets[list_id]:offsets[list_id + 1]]
+            if len(members) == 0:
+                continue
+            k_found = min(k, len(members))
+            pairs = by_list[pair_offsets[list_id]:pair_offsets[list_id + 1]]
+            block_size = max(1, BLOCK_ELEMENTS // len(members))
+            for start in range(0, len(pairs), block_size):
+                block_pairs = pairs[start:start + block_size]
+                block = local[pair_query[block_pairs]]
+                dist = (partition.norms[block, None] - 2 * partition.vectors[block] @ partition.vectors[members].T
+                        + partition.norms[members])
+                dist[members == block[:, None]] = np.inf
+                top = np.argpartition(dist, k_found - 1, axis=1)[:, :k_found]
+                pair_neighbors[block_pairs, :k_found] = members[top]
+                pair_distances[block_pairs, :k_found] = np.take_along_axis(dist, top, axis=1)
+
+        candidates = pair_neighbors.reshape(len(local), n_probe * k)
+        dist = pair_distances.reshape(len(local), n_probe * k)
+        top = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        top_dist = np.take_along_axis(dist, top, axis=1)
+        order = np.argsort(top_dist, axis=1)
+        top_dist = np.take_along_axis(top_dist, order, axis=1)
+        found = np.take_along_axis(candidates, np.take_along_axis(top, order, axis=1), axis=1)
+        return np.where(np.isinf(top_dist), -1, found), np.maximum(top_dist, 0)
+
+    @staticmethod
+    def _feature_matrix(df: pd.DataFrame) -> np.ndarray:
+        """Standardized float32 features with room type one-hot encoded"""
+        numeric = df[NUMERIC_FEATURES].to_numpy(dtype=np.float64)
+        mean = np.nanmean(numeric, axis=0)
+        std = np.nanstd(numeric, axis=0)
+        std[std == 0] = 1
+        numeric = np.nan_to_num((numeric - mean) / std)
+
+        room_types = pd.get_dummies(df['room_type']).to_numpy(dtype=np.float64)
+        return np.hstack([numeric, room_types]).astype(np.float32)
+
+
+if __name__ == "__main__":
+    # Example usage
+    import time
+    from pathlib import Path
+
+    try:
+        data_path = Path(__file__).parent.parent / 'processed_airbnb_data.csv'
+        df = pd.read_csv(data_path)
+        index = ListingSimilarityIndex(df)
+
+        print("=== Comps for the first listing ===")
+        print(index.similar_listings(0, k=5)[['city', 'room_type', 'realSum', 'distance']])
+
+        queries = np.random.default_rng(0).choice(len(df), 5000, replace=False)
+        start = time.perf_counter()
+        index.query(queries, k=20)
+        elapsed = time.perf_counter() - start
+        print(f"\n{len(queries) / elapsed:.0f} comp lookups per second")
+        print(f"Recall@20 vs exact search: {index.recall():.3f}")
+
+    except FileNotFoundError:
+        print("Processed data file not found. Please run ETL pipeline first.")
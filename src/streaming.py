@@ -0,0 +1,179 @@
+"""
+Streaming Append API for Airbnb Listings
+Business Intelligence Engineer - Incremental Analytics Module
+
+StreamingAnalytics absorbs new listings without rebuilding the dataset.
+Each appended batch goes through the row-local part of the ETL transform
+(AirbnbETLPipeline.transform_batch) and is folded into materialized
+PartialAggregates, so per-city counts, running sums, price sketches and
+correlation co-moments are updated in time proportional to the batch.
+
+price_segment cut points are dataset-wide quantiles. Appended rows are
+segmented with the existing cut points, which are then marked stale; they
+are re-derived once the appended rows exceed refresh_fraction of the data
+present at the last derivation (or on demand via refresh_segments).
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.etl_pipeline import AirbnbETLPipeline, CITIES, PERIODS
+from src.analysis_queries import AirbnbAnalytics
+from src.aggregates import PartialAggregates
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingAnalytics:
+    """Analytical queries over a processed dataset that accepts appended rows"""
+
+    def __init__(self, pipeline: AirbnbETLPipeline, refresh_fraction: Optional[float] = 0.1):
+        """
+        Initialize from a pipeline that has already run transform
+
+        Args:
+            pipeline: ETL pipeline holding processed_data and its transform statistics
+            refresh_fraction: Re-derive segment cut points once appended rows exceed
+                this fraction of the data at the last derivation (None: manual only)
+        """
+        if pipeline.processed_data is None:
+            raise ValueError("Pipeline has no processed data. Run the pipeline first.")
+
+        self.pipeline = pipeline
+        self.refresh_fraction = refresh_fraction
+        self.aggregates = PartialAggregates.from_frame(pipeline.processed_data)
+
+        self._chunks = [pipeline.processed_data]
+        self._frame = pipeline.processed_data
+        self._rows_at_refresh = len(pipeline.processed_data)
+        self.stale_rows = 0
+
+    @property
+    def segments_stale(self) -> bool:
+        """Whether rows were appended since the segment cut points were derived"""
+        return self.stale_rows > 0
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Full processed DataFrame including appended rows (concatenated lazily)"""
+        if self._frame is None:
+            self._frame = pd.concat(self._chunks, ignore_index=True)
+            self._chunks = [self._frame]
+            self.pipeline.processed_data = self._frame
+        return self._frame
+
+    def append(self, rows: Union[pd.DataFrame, Iterable[Dict]]) -> pd.DataFrame:
+        """
+        Append new listings and update the materialized aggregates
+
+        Args:
+            rows: DataFrame or iterable of record dicts in the raw CSV layout,
+                including 'city' and 'period'
+
+        Returns:
+            The transformed batch
+        """
+        batch = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame.from_records(list(rows))
+        if batch.empty:
+            return batch
+
+        missing = {'city', 'period'} - set(batch.columns)
+        if missing:
+            raise ValueError(f"Appended rows are missing columns: {sorted(missing)}")
+
+        processed_batch = self.pipeline.transform_batch(batch)
+        self.aggregates = self.aggregates.merge(PartialAggregates.from_frame(processed_batch))
+        self._chunks.append(processed_batch)
+        self._frame = None
+        self.stale_rows += len(processed_batch)
+        logger.info(f"Appended {len(processed_batch)} records ({self.stale_rows} since last segment refresh)")
+
+        if (self.refresh_fraction is not None
+                and self.stale_rows > self.refresh_fraction * self._rows_at_refresh):
+            self.refresh_segments()
+
+        return processed_batch
+
+    def refresh_segments(self):
+        """Re-derive price_segment cut points over all rows and reassign segments"""
+        df = self.df
+        bins = self.pipeline.derive_segment_bins(df['realSum'])
+        df['price_segment'] = pd.cut(df['realSum'], bins=bins,
+                                     labels=['Budget', 'Mid-range', 'Premium'])
+
+        self.pipeline.segment_bins = bins
+        self._rows_at_refresh = len(df)
+        self.stale_rows = 0
+        logger.info(f"Segment cut points re-derived over {len(df)} records")
+
+    # ------------------------------------------------------------------
+    # Queries answered from the materialized aggregates
+    # ------------------------------------------------------------------
+
+    def top_n_cities_by_price(self, n: int = 5) -> pd.DataFrame:
+        """Query: Top N cities by average price"""
+        return self.aggregates.top_n_cities_by_price(n)
+
+    def superhost_performance_analysis(self) -> pd.DataFrame:
+        """Query: Superhost vs regular host performance"""
+        return self.aggregates.superhost_performance_analysis()
+
+    def weekend_vs_weekday_pricing(self) -> Dict:
+        """Query: Weekend vs weekday pricing comparison"""
+        return self.aggregates.weekend_vs_weekday_pricing()
+
+    def top_products_by_sales(self, n: int = 3) -> pd.DataFrame:
+        """Query: Top N cities by listing count"""
+        return self.aggregates.top_products_by_sales(n)
+
+    def customer_lifetime_value(self, city: str = None) -> pd.DataFrame:
+        """Query: Highest value cities by price per person and satisfaction"""
+        return self.aggregates.customer_lifetime_value(city)
+
+    def inventory_analysis(self, threshold_days: int = 30) -> pd.DataFrame:
+        """Query: Identify cities with supply concerns"""
+        return self.aggregates.inventory_analysis(threshold_days)
+
+    def revenue_by_country_year_month(self, city: str) -> pd.DataFrame:
+        """Query: Revenue breakdown by city and period"""
+        return self.aggregates.revenue_by_country_year_month(city)
+
+    def correlation_analysis(self, columns: List[str] = None) -> pd.DataFrame:
+        """Query: Correlation matrix for numeric columns"""
+        return self.aggregates.correlation_analysis(columns)
+
+    # ------------------------------------------------------------------
+    # Queries that need the full frame
+    # ------------------------------------------------------------------
+
+    def room_type_distribution_by_city(self) -> pd.DataFrame:
+        """Query: Room type distribution by city"""
+        return AirbnbAnalytics(self.df).room_type_distribution_by_city()
+
+    def market_segmentation_analysis(self) -> pd.DataFrame:
+        """Query: Market segmentation by price segment and city"""
+        return AirbnbAnalytics(self.df).market_segmentation_analysis()
+
+
+if __name__ == "__main__":
+    # Example usage: replay one city file as a stream of appended batches
+    data_dir = Path(__file__).parent.parent / 'data'
+
+    pipeline = AirbnbETLPipeline(str(data_dir), [c for c in CITIES if c != 'vienna'], PERIODS)
+    pipeline.run_pipeline()
+    streaming = StreamingAnalytics(pipeline)
+
+    new_listings = pd.read_csv(data_dir / 'vienna_weekdays.csv').assign(city='Vienna', period='weekdays')
+    for start in range(0, len(new_listings), 500):
+        streaming.append(new_listings.iloc[start:start + 500])
+
+    print("=== Top 5 Cities by Listing Count ===")
+    print(streaming.top_products_by_sales(5))
+    print(f"\nSegment cut points stale: {streaming.segments_stale}")
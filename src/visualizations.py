@@ -7,21 +7,59 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
 import numpy as np
+import inspect
+from io import BytesIO
+from matplotlib.colors import LogNorm, to_rgba
+from matplotlib.transforms import Bbox
+from PIL import Image
 from typing import Optional, List, Tuple
 
 
 class AirbnbVisualizations:
     """Collection of visualization functions for Airbnb data analysis"""
     
-    def __init__(self, df: pd.DataFrame, style: str = 'seaborn-v0_8-darkgrid'):
+    HEATMAP_COLUMNS = ['realSum', 'person_capacity', 'bedrooms', 'cleanliness_rating',
+                       'guest_satisfaction_overall', 'dist', 'metro_dist',
+                       'attr_index_norm', 'rest_index_norm', 'price_per_person', 'location_score']
+    DASHBOARD_HEATMAP_COLUMNS = ['realSum', 'person_capacity', 'bedrooms', 'cleanliness_rating',
+                                 'guest_satisfaction_overall', 'dist', 'attr_index_norm', 
+                                 'rest_index_norm', 'price_per_person']
+    
+    # Raster grid measures: name -> (source column or None for counts, label)
+    RASTER_MEASURES = {
+        'count': (None, 'Listings per pixel'),
+        'price': ('realSum', 'Mean price (realSum)'),
+        'satisfaction': ('guest_satisfaction_overall', 'Mean guest satisfaction')
+    }
+    
+    # Standalone plots available through render_plot/save_plot:
+    # name -> (plotting method name, columns it reads or None for aggregate inputs)
+    PLOTS = {
+        'price_distribution': ('plot_price_distribution_by_city', ['city', 'realSum']),
+        'room_type_analysis': ('plot_room_type_analysis', ['room_type', 'realSum']),
+        'city_supply_dashboard': ('plot_city_supply_dashboard', None),
+        'correlation_heatmap': ('plot_correlation_heatmap', None),
+        'period_comparison': ('plot_period_comparison', ['period', 'realSum', 'guest_satisfaction_overall']),
+        'market_segmentation': ('plot_market_segmentation', ['price_segment', 'guest_satisfaction_overall']),
+        'location_analysis': ('plot_location_analysis', ['location_quality', 'realSum'])
+    }
+    
+    DASHBOARD_FIGSIZE = (20, 16)
+    DASHBOARD_GRID = (4, 3)
+    
+    def __init__(self, df: pd.DataFrame, style: str = 'seaborn-v0_8-darkgrid', render_cache=None):
         """
         Initialize visualization class
         
         Args:
             df: Processed DataFrame
             style: Matplotlib style
+            render_cache: Optional RenderCache used by render_plot and the full dashboard
         """
         self.df = df
+        self.style = style
+        self.render_cache = render_cache
+        self._raster_cache = {}
         plt.style.use(style)
         sns.set_palette("husl")
     
@@ -59,15 +97,14 @@ class AirbnbVisualizations:
     def plot_city_supply_dashboard(self, figsize: Tuple[int, int] = (16, 12)):
         """Comprehensive city supply analysis dashboard"""
         fig, axes = plt.subplots(2, 2, figsize=figsize)
+        city_price, city_count, superhost_pct, satisfaction = self._city_supply_inputs()
         
         # Average price by city
-        city_price = self.df.groupby('city')['realSum'].mean().sort_values(ascending=False)
         axes[0, 0].barh(city_price.index, city_price.values, color='steelblue')
         axes[0, 0].set_title('Average Price by City', fontsize=12, fontweight='bold')
         axes[0, 0].set_xlabel('Average Price')
         
         # Listing count by city
-        city_count = self.df.groupby('city').size().sort_values(ascending=False)
         axes[0, 1].bar(city_count.index, city_count.values, color='coral')
         axes[0, 1].set_title('Number of Listings by City', fontsize=12, fontweight='bold')
         axes[0, 1].set_xlabel('City')
@@ -75,7 +112,6 @@ class AirbnbVisualizations:
         axes[0, 1].tick_params(axis='x', rotation=45)
         
         # Superhost percentage
-        superhost_pct = self.df.groupby('city')['host_is_superhost'].mean() * 100
         axes[1, 0].bar(superhost_pct.index, superhost_pct.values, color='green')
         axes[1, 0].set_title('Superhost Percentage by City', fontsize=12, fontweight='bold')
         axes[1, 0].set_xlabel('City')
@@ -83,7 +119,6 @@ class AirbnbVisualizations:
         axes[1, 0].tick_params(axis='x', rotation=45)
         
         # Average satisfaction
-        satisfaction = self.df.groupby('city')['guest_satisfaction_overall'].mean().sort_values(ascending=False)
         axes[1, 1].barh(satisfaction.index, satisfaction.values, color='purple')
         axes[1, 1].set_title('Average Guest Satisfaction by City', fontsize=12, fontweight='bold')
         axes[1, 1].set_xlabel('Average Satisfaction Score')
@@ -93,12 +128,7 @@ class AirbnbVisualizations:
     
     def plot_correlation_heatmap(self, figsize: Tuple[int, int] = (12, 10)):
         """Correlation matrix heatmap"""
-        numeric_cols = ['realSum', 'person_capacity', 'bedrooms', 'cleanliness_rating',
-                        'guest_satisfaction_overall', 'dist', 'metro_dist',
-                        'attr_index_norm', 'rest_index_norm', 'price_per_person', 'location_score']
-        
-        available_cols = [col for col in numeric_cols if col in self.df.columns]
-        correlation_matrix = self.df[available_cols].corr()
+        correlation_matrix = self._correlation_input(self.HEATMAP_COLUMNS)
         
         plt.figure(figsize=figsize)
         sns.heatmap(correlation_matrix, annot=True, fmt='.2f', cmap='coolwarm',
@@ -168,86 +198,455 @@ class AirbnbVisualizations:
         plt.tight_layout()
         return plt
     
-    def generate_full_dashboard(self, save_path: Optional[str] = None):
-        """Generate complete dashboard with all visualizations"""
-        # Create figure with subplots
-        fig = plt.figure(figsize=(20, 16))
-        gs = fig.add_gridspec(4, 3, hspace=0.3, wspace=0.3)
+    def build_tile_pyramid(self, city: str, resolution: int = 512) -> List[dict]:
+        """
+        Rasterize a city's listings into a pyramid of lng/lat grids
         
-        # 1. Price distribution by city
-        ax1 = fig.add_subplot(gs[0, :])
-        df_sorted = self.df.sort_values('realSum')
-        sns.boxplot(data=df_sorted, x='city', y='realSum', ax=ax1, palette='Set2')
-        ax1.set_title('Price Distribution by City', fontsize=14, fontweight='bold')
-        ax1.set_xticklabels(ax1.get_xticklabels(), rotation=45, ha='right')
+        Level 0 bins every listing into a resolution x resolution pixel grid
+        (counts and per-measure sums); each next level halves the resolution
+        by summing 2x2 blocks. Pyramids are cached per (city, resolution).
         
-        # 2. Room type distribution
-        ax2 = fig.add_subplot(gs[1, 0])
-        room_counts = self.df['room_type'].value_counts()
-        ax2.pie(room_counts.values, labels=room_counts.index, autopct='%1.1f%%', startangle=90)
-        ax2.set_title('Room Type Distribution', fontsize=12, fontweight='bold')
+        Args:
+            city: City name as stored in the 'city' column
+            resolution: Pixels per side at level 0 (a power of two)
+            
+        Returns:
+            List of levels, each a dict with 'count', 'sum_<column>' grids and 'extent'
+        """
+        if resolution < 1 or resolution & (resolution - 1):
+            raise ValueError(f"Resolution must be a power of two, got {resolution}")
+        
+        key = (city, resolution)
+        if key in self._raster_cache:
+            return self._raster_cache[key]
+        
+        city_df = self.df[self.df['city'] == city]
+        if city_df.empty:
+            raise ValueError(f"No listings found for city: {city}")
+        
+        lng = city_df['lng'].to_numpy(dtype=float)
+        lat = city_df['lat'].to_numpy(dtype=float)
+        extent = (lng.min(), lng.max(), lat.min(), lat.max())
+        
+        # Vectorized binning: one flat pixel index per listing, one bincount per grid
+        col = self._pixel_index(lng, extent[0], extent[1], resolution)
+        row = self._pixel_index(lat, extent[2], extent[3], resolution)
+        pixel = row * resolution + col
+        
+        level = {'extent': extent,
+                 'count': np.bincount(pixel, minlength=resolution ** 2).reshape(resolution, resolution)}
+        for column, _ in self.RASTER_MEASURES.values():
+            if column is not None:
+                values = city_df[column].to_numpy(dtype=float)
+                grid = np.bincount(pixel, weights=np.nan_to_num(values), minlength=resolution ** 2)
+                level[f"sum_{column}"] = grid.reshape(resolution, resolution)
+        
+        pyramid = [level]
+        while pyramid[-1]['count'].shape[0] > 1:
+            previous = pyramid[-1]
+            size = previous['count'].shape[0] // 2
+            pyramid.append({
+                name: grid if name == 'extent' else grid.reshape(size, 2, size, 2).sum(axis=(1, 3))
+                for name, grid in previous.items()
+            })
+        
+        self._raster_cache[key] = pyramid
+        return pyramid
+    
+    def save_tile_pyramid(self, city: str, path: str, resolution: int = 512):
+        """
+        Save a city's tile pyramid to a compressed .npz file for reuse
         
-        # 3. Average price by city
-        ax3 = fig.add_subplot(gs[1, 1])
-        city_price = self.df.groupby('city')['realSum'].mean().sort_values(ascending=False)
-        ax3.barh(range(len(city_price)), city_price.values, color='steelblue')
-        ax3.set_yticks(range(len(city_price)))
-        ax3.set_yticklabels(city_price.index)
-        ax3.set_title('Average Price by City', fontsize=12, fontweight='bold')
-        ax3.set_xlabel('Average Price')
-        
-        # 4. Listing count
-        ax4 = fig.add_subplot(gs[1, 2])
-        city_count = self.df.groupby('city').size().sort_values(ascending=False)
-        ax4.bar(range(len(city_count)), city_count.values, color='coral')
-        ax4.set_xticks(range(len(city_count)))
-        ax4.set_xticklabels(city_count.index, rotation=45, ha='right')
-        ax4.set_title('Listings by City', fontsize=12, fontweight='bold')
-        ax4.set_ylabel('Count')
-        
-        # 5. Weekend vs Weekday
-        ax5 = fig.add_subplot(gs[2, 0])
-        sns.boxplot(data=self.df, x='period', y='realSum', ax=ax5)
-        ax5.set_title('Price: Weekday vs Weekend', fontsize=12, fontweight='bold')
-        
-        # 6. Superhost percentage
-        ax6 = fig.add_subplot(gs[2, 1])
-        superhost_pct = self.df.groupby('city')['host_is_superhost'].mean() * 100
-        ax6.bar(range(len(superhost_pct)), superhost_pct.values, color='green')
-        ax6.set_xticks(range(len(superhost_pct)))
-        ax6.set_xticklabels(superhost_pct.index, rotation=45, ha='right')
-        ax6.set_title('Superhost % by City', fontsize=12, fontweight='bold')
-        ax6.set_ylabel('Percentage (%)')
-        
-        # 7. Satisfaction by city
-        ax7 = fig.add_subplot(gs[2, 2])
-        satisfaction = self.df.groupby('city')['guest_satisfaction_overall'].mean().sort_values(ascending=False)
-        ax7.barh(range(len(satisfaction)), satisfaction.values, color='purple')
-        ax7.set_yticks(range(len(satisfaction)))
-        ax7.set_yticklabels(satisfaction.index)
-        ax7.set_title('Avg Satisfaction by City', fontsize=12, fontweight='bold')
-        ax7.set_xlabel('Satisfaction Score')
-        
-        # 8. Correlation heatmap
-        ax8 = fig.add_subplot(gs[3, :])
-        numeric_cols = ['realSum', 'person_capacity', 'bedrooms', 'cleanliness_rating',
-                        'guest_satisfaction_overall', 'dist', 'attr_index_norm', 
-                        'rest_index_norm', 'price_per_person']
-        available_cols = [col for col in numeric_cols if col in self.df.columns]
-        corr_matrix = self.df[available_cols].corr()
-        sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', center=0,
-                   ax=ax8, square=True, linewidths=1, cbar_kws={"shrink": 0.8})
-        ax8.set_title('Feature Correlation Matrix', fontsize=14, fontweight='bold')
+        Args:
+            city: City name
+            path: Output file path
+            resolution: Pixels per side at level 0
+        """
+        pyramid = self.build_tile_pyramid(city, resolution)
+        arrays = {f"level{i}_{name}": np.asarray(grid)
+                  for i, level in enumerate(pyramid) for name, grid in level.items()}
+        np.savez_compressed(path, **arrays)
+    
+    def load_tile_pyramid(self, city: str, path: str) -> List[dict]:
+        """
+        Load a tile pyramid written by save_tile_pyramid into the raster cache
+        
+        Later build_tile_pyramid/plot_spatial_heatmap calls for the city at the
+        saved resolution use the loaded grids instead of rebinning listings.
+        
+        Args:
+            city: City name the pyramid belongs to
+            path: .npz file path
+            
+        Returns:
+            List of levels, as returned by build_tile_pyramid
+        """
+        levels = {}
+        with np.load(path) as arrays:
+            for key in arrays.files:
+                level, name = key.split('_', 1)
+                levels.setdefault(int(level[len('level'):]), {})[name] = arrays[key]
+        
+        pyramid = [levels[i] for i in range(len(levels))]
+        for level in pyramid:
+            level['extent'] = tuple(float(v) for v in level['extent'])
+        
+        self._raster_cache[(city, pyramid[0]['count'].shape[0])] = pyramid
+        return pyramid
+    
+    def plot_spatial_heatmap(self, city: str, measure: str = 'count', resolution: int = 512,
+                             level: int = 0, bbox: Optional[Tuple[float, float, float, float]] = None,
+                             figsize: Tuple[int, int] = (10, 8)):
+        """
+        Rasterized lng/lat heatmap of listing density, mean price or mean satisfaction
+        
+        Render time depends on the pixel count, not on the number of listings.
+        
+        Args:
+            city: City name
+            measure: Key of RASTER_MEASURES
+            resolution: Pixels per side at level 0
+            level: Pyramid level (0 is the finest)
+            bbox: Optional (lng_min, lng_max, lat_min, lat_max) to zoom into;
+                the grid is cropped to the pixels overlapping it
+            figsize: Figure size
+        """
+        column, label = self.RASTER_MEASURES[measure]
+        tile = self.build_tile_pyramid(city, resolution)[level]
+        if bbox is not None:
+            tile = self._crop_tile(tile, bbox)
+        
+        counts = tile['count']
+        if column is None:
+            image = np.where(counts > 0, counts, np.nan)
+            limits = {'norm': LogNorm()}
+        else:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                image = np.where(counts > 0, tile[f"sum_{column}"] / counts, np.nan)
+            # Clip the colour scale so a few extreme pixels do not flatten the map
+            vmin, vmax = np.nanpercentile(image, [2, 98])
+            limits = {'vmin': vmin, 'vmax': vmax}
+        
+        fig, ax = plt.subplots(figsize=figsize)
+        im = ax.imshow(image, origin='lower', extent=tile['extent'], cmap='viridis',
+                       interpolation='nearest', aspect='auto', **limits)
+        ax.grid(False)
+        fig.colorbar(im, ax=ax, label=label)
+        ax.set_title(f'{city}: {label}', fontsize=14, fontweight='bold')
+        ax.set_xlabel('Longitude')
+        ax.set_ylabel('Latitude')
+        plt.tight_layout()
+        return plt
+    
+    @staticmethod
+    def _crop_tile(tile: dict, bbox: Tuple[float, float, float, float]) -> dict:
+        """Crop a pyramid level to the pixels overlapping a lng/lat bounding box"""
+        lng_min, lng_max, lat_min, lat_max = tile['extent']
+        size = tile['count'].shape[0]
+        bounds = []
+        for low, high, box_low, box_high in [(lng_min, lng_max, bbox[0], bbox[1]),
+                                             (lat_min, lat_max, bbox[2], bbox[3])]:
+            pixel = (high - low if high > low else 1.0) / size
+            first = int(np.clip(np.floor((box_low - low) / pixel), 0, size))
+            last = int(np.clip(np.ceil((box_high - low) / pixel), 0, size))
+            if first >= last:
+                raise ValueError(f"Bounding box {bbox} does not overlap the city extent {tile['extent']}")
+            bounds.append((first, last, low + first * pixel, low + last * pixel))
+        
+        (col0, col1, x0, x1), (row0, row1, y0, y1) = bounds
+        cropped = {name: grid[row0:row1, col0:col1] for name, grid in tile.items() if name != 'extent'}
+        cropped['extent'] = (x0, x1, y0, y1)
+        return cropped
+    
+    @staticmethod
+    def _pixel_index(values: np.ndarray, low: float, high: float, resolution: int) -> np.ndarray:
+        """Map coordinates onto [0, resolution) pixel indices"""
+        span = high - low if high > low else 1.0
+        return np.clip(((values - low) / span * resolution).astype(np.int64), 0, resolution - 1)
+    
+    def render_plot(self, name: str, dpi: int = 300, figsize: Optional[Tuple[int, int]] = None) -> bytes:
+        """
+        Render a plot to PNG bytes, served from the render cache when possible
+        
+        Args:
+            name: Plot name (a key of PLOTS, or 'full_dashboard')
+            dpi: Output resolution
+            figsize: Figure size (defaults to the plotting method's default;
+                not supported for 'full_dashboard')
+            
+        Returns:
+            PNG bytes
+        """
+        if name == 'full_dashboard':
+            if figsize is not None:
+                raise ValueError("The full dashboard has a fixed size (DASHBOARD_FIGSIZE)")
+            return self._render_dashboard(dpi)
+        
+        method_name, columns = self.PLOTS[name]
+        method = getattr(self, method_name)
+        if figsize is None:
+            figsize = inspect.signature(method).parameters['figsize'].default
+        
+        def render():
+            method(figsize=figsize)
+            return self._figure_to_png(plt.gcf(), dpi)
+        
+        if self.render_cache is None:
+            return render()
+        
+        if columns is not None:
+            inputs = [self.df[columns]]
+        elif name == 'city_supply_dashboard':
+            inputs = list(self._city_supply_inputs())
+        else:
+            inputs = [self._correlation_input(self.HEATMAP_COLUMNS)]
+        params = self._render_params(figsize, dpi)
+        return self.render_cache.get_or_render(name, inputs, params, render, code=method)
+    
+    def save_plot(self, name: str, save_path: str, dpi: int = 300):
+        """
+        Render a plot and write it to a PNG file
         
-        plt.suptitle('Airbnb Supply Analysis - Comprehensive Dashboard', 
-                    fontsize=18, fontweight='bold', y=0.995)
+        Args:
+            name: Plot name (a key of PLOTS, or 'full_dashboard')
+            save_path: Output file path
+            dpi: Output resolution
+        """
+        with open(save_path, 'wb') as f:
+            f.write(self.render_plot(name, dpi))
+    
+    def generate_full_dashboard(self, save_path: Optional[str] = None, dpi: int = 300):
+        """
+        Generate complete dashboard with all visualizations
+        
+        With a render cache the dashboard is composited from cached per-panel
+        layers, so one changed panel does not force redrawing the other seven.
+        """
+        if self.render_cache is not None:
+            png = self._render_dashboard(dpi)
+            if save_path:
+                with open(save_path, 'wb') as f:
+                    f.write(png)
+                print(f"Dashboard saved to {save_path}")
+            return plt
+        
+        self._draw_dashboard(self._dashboard_inputs())
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
             print(f"Dashboard saved to {save_path}")
         
         return plt
-
+    
+    def _render_dashboard(self, dpi: int) -> bytes:
+        """
+        Render the full dashboard to PNG bytes through the cache
+        
+        Each panel (and the title) is cached as a transparent layer cut from
+        a full dashboard figure, tagged with its pixel offset. A changed panel
+        only redraws its own layer; the layers are then composited in drawing
+        order into the same layout as a single-figure render. The composite
+        itself is cached under the panel keys, so an unchanged dashboard is
+        served without drawing or compositing.
+        """
+        panels = self._dashboard_inputs()
+        if self.render_cache is None:
+            return self._figure_to_png(self._draw_dashboard(panels), dpi)
+        
+        params = self._render_params(self.DASHBOARD_FIGSIZE, dpi)
+        layout = [self._dashboard_figure, self._render_layer]
+        layers = [(f"dashboard_{name}", [data], {**params, 'cell': repr(cell)}, [draw] + layout,
+                   lambda fig, gs, cell=cell, data=data, draw=draw: draw(fig.add_subplot(gs[cell]), data))
+                  for name, cell, data, draw in panels]
+        layers.append(('dashboard_title', [], params, [self._draw_dashboard_title] + layout,
+                       lambda fig, gs: self._draw_dashboard_title(fig)))
+        
+        def compose():
+            pngs = [self.render_cache.get_or_render(name, inputs, layer_params,
+                                                    lambda draw_layer=draw_layer: self._render_layer(draw_layer, dpi),
+                                                    code=code)
+                    for name, inputs, layer_params, code, draw_layer in layers]
+            return self._composite_layers(pngs, dpi)
+        
+        layer_keys = [self.render_cache.key(name, inputs, layer_params, code=code)
+                      for name, inputs, layer_params, code, _ in layers]
+        return self.render_cache.get_or_render('full_dashboard', layer_keys, params, compose,
+                                               code=self._composite_layers)
+    
+    def _dashboard_figure(self):
+        """Empty dashboard figure and its gridspec"""
+        fig = plt.figure(figsize=self.DASHBOARD_FIGSIZE)
+        gs = fig.add_gridspec(*self.DASHBOARD_GRID, hspace=0.3, wspace=0.3)
+        return fig, gs
+    
+    def _draw_dashboard(self, panels: List[Tuple]):
+        """Draw the dashboard panels onto one gridspec figure"""
+        fig, gs = self._dashboard_figure()
+        
+        for name, cell, data, draw in panels:
+            draw(fig.add_subplot(gs[cell]), data)
+        
+        self._draw_dashboard_title(fig)
+        return fig
+    
+    def _draw_dashboard_title(self, fig):
+        """Dashboard title"""
+        fig.suptitle('Airbnb Supply Analysis - Comprehensive Dashboard', 
+                     fontsize=18, fontweight='bold', y=0.995)
+    
+    def _render_layer(self, draw_layer, dpi: int) -> bytes:
+        """
+        Render part of the dashboard as a transparent PNG layer
+        
+        The layer is cropped to the whole-pixel extent of what it draws, and
+        its offset from the figure origin is stored in the PNG metadata.
+        Layers only live in the cache, so they use fast PNG compression.
+        """
+        fig, gs = self._dashboard_figure()
+        draw_layer(fig, gs)
+        fig.set_dpi(dpi)
+        extent = fig.get_tightbbox(fig.canvas.get_renderer())
+        x0, y0 = np.floor([extent.x0 * dpi, extent.y0 * dpi]).astype(int)
+        x1, y1 = np.ceil([extent.x1 * dpi, extent.y1 * dpi]).astype(int)
+        
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, facecolor='none',
+                    bbox_inches=Bbox.from_extents(x0 / dpi, y0 / dpi, x1 / dpi, y1 / dpi),
+                    pad_inches=0, metadata={'Offset': f"{x0},{y0}"},
+                    pil_kwargs={'compress_level': 1})
+        plt.close(fig)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _composite_layers(pngs: List[bytes], dpi: int) -> bytes:
+        """Composite PNG layers in order onto the figure background, cropped like bbox_inches='tight'"""
+        layers = []
+        for png in pngs:
+            image = Image.open(BytesIO(png))
+            x0, y0 = (int(v) for v in image.text['Offset'].split(','))
+            layers.append((x0, y0, image.convert('RGBA')))
+        
+        # Union of the layer extents (pixels, origin bottom left) plus the savefig padding
+        pad = int(round(plt.rcParams['savefig.pad_inches'] * dpi))
+        left = min(x0 for x0, _, _ in layers) - pad
+        bottom = min(y0 for _, y0, _ in layers) - pad
+        right = max(x0 + image.width for x0, _, image in layers) + pad
+        top = max(y0 + image.height for _, y0, image in layers) + pad
+        
+        background = tuple(int(round(c * 255)) for c in to_rgba(plt.rcParams['figure.facecolor']))
+        canvas = Image.new('RGBA', (right - left, top - bottom), background)
+        for x0, y0, image in layers:
+            canvas.alpha_composite(image, dest=(x0 - left, top - (y0 + image.height)))
+        
+        buffer = BytesIO()
+        canvas.convert('RGB').save(buffer, format='png', dpi=(dpi, dpi))
+        return buffer.getvalue()
+    
+    def _dashboard_inputs(self) -> List[Tuple]:
+        """(name, grid cell, data, draw function) for each dashboard panel"""
+        return [(name, cell, inputs(), draw) for name, cell, inputs, draw in self._dashboard_panels()]
+    
+    def _render_params(self, figsize: Tuple[int, int], dpi: int) -> dict:
+        """Render parameters that affect the output image"""
+        return {'figsize': list(figsize), 'dpi': dpi, 'style': self.style,
+                'palette': sns.color_palette().as_hex()}
+    
+    def _dashboard_panels(self) -> List[Tuple]:
+        """(name, grid cell, input builder, draw function) for each dashboard panel"""
+        supply = []
+        
+        def city_supply(i):
+            if not supply:
+                supply.extend(self._city_supply_inputs())
+            return supply[i]
+        
+        return [
+            ('price_by_city', (0, slice(None)), lambda: self.df[['city', 'realSum']], self._draw_price_by_city),
+            ('room_types', (1, 0), lambda: self.df['room_type'].value_counts(), self._draw_room_types),
+            ('avg_price', (1, 1), lambda: city_supply(0), self._draw_avg_price),
+            ('listing_count', (1, 2), lambda: city_supply(1), self._draw_listing_count),
+            ('period_price', (2, 0), lambda: self.df[['period', 'realSum']], self._draw_period_price),
+            ('superhost_pct', (2, 1), lambda: city_supply(2), self._draw_superhost_pct),
+            ('satisfaction', (2, 2), lambda: city_supply(3), self._draw_satisfaction),
+            ('correlation', (3, slice(None)), lambda: self._correlation_input(self.DASHBOARD_HEATMAP_COLUMNS),
+             self._draw_correlation)
+        ]
+    
+    def _draw_price_by_city(self, ax, data: pd.DataFrame):
+        """1. Price distribution by city"""
+        df_sorted = data.sort_values('realSum')
+        sns.boxplot(data=df_sorted, x='city', y='realSum', ax=ax, palette='Set2')
+        ax.set_title('Price Distribution by City', fontsize=14, fontweight='bold')
+        ax.set_xticklabels(ax.get_xticklabels(), rotation=45, ha='right')
+    
+    def _draw_room_types(self, ax, room_counts: pd.Series):
+        """2. Room type distribution"""
+        ax.pie(room_counts.values, labels=room_counts.index, autopct='%1.1f%%', startangle=90)
+        ax.set_title('Room Type Distribution', fontsize=12, fontweight='bold')
+    
+    def _draw_avg_price(self, ax, city_price: pd.Series):
+        """3. Average price by city"""
+        ax.barh(range(len(city_price)), city_price.values, color='steelblue')
+        ax.set_yticks(range(len(city_price)))
+        ax.set_yticklabels(city_price.index)
+        ax.set_title('Average Price by City', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Average Price')
+    
+    def _draw_listing_count(self, ax, city_count: pd.Series):
+        """4. Listing count"""
+        ax.bar(range(len(city_count)), city_count.values, color='coral')
+        ax.set_xticks(range(len(city_count)))
+        ax.set_xticklabels(city_count.index, rotation=45, ha='right')
+        ax.set_title('Listings by City', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Count')
+    
+    def _draw_period_price(self, ax, data: pd.DataFrame):
+        """5. Weekend vs Weekday"""
+        sns.boxplot(data=data, x='period', y='realSum', ax=ax)
+        ax.set_title('Price: Weekday vs Weekend', fontsize=12, fontweight='bold')
+    
+    def _draw_superhost_pct(self, ax, superhost_pct: pd.Series):
+        """6. Superhost percentage"""
+        ax.bar(range(len(superhost_pct)), superhost_pct.values, color='green')
+        ax.set_xticks(range(len(superhost_pct)))
+        ax.set_xticklabels(superhost_pct.index, rotation=45, ha='right')
+        ax.set_title('Superhost % by City', fontsize=12, fontweight='bold')
+        ax.set_ylabel('Percentage (%)')
+    
+    def _draw_satisfaction(self, ax, satisfaction: pd.Series):
+        """7. Satisfaction by city"""
+        ax.barh(range(len(satisfaction)), satisfaction.values, color='purple')
+        ax.set_yticks(range(len(satisfaction)))
+        ax.set_yticklabels(satisfaction.index)
+        ax.set_title('Avg Satisfaction by City', fontsize=12, fontweight='bold')
+        ax.set_xlabel('Satisfaction Score')
+    
+    def _draw_correlation(self, ax, corr_matrix: pd.DataFrame):
+        """8. Correlation heatmap"""
+        sns.heatmap(corr_matrix, annot=True, fmt='.2f', cmap='coolwarm', center=0,
+                   ax=ax, square=True, linewidths=1, cbar_kws={"shrink": 0.8})
+        ax.set_title('Feature Correlation Matrix', fontsize=14, fontweight='bold')
+    
+    def _city_supply_inputs(self) -> Tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+        """Per-city aggregates behind the supply charts"""
+        city_price = self.df.groupby('city')['realSum'].mean().sort_values(ascending=False)
+        city_count = self.df.groupby('city').size().sort_values(ascending=False)
+        superhost_pct = self.df.groupby('city')['host_is_superhost'].mean() * 100
+        satisfaction = self.df.groupby('city')['guest_satisfaction_overall'].mean().sort_values(ascending=False)
+        return city_price, city_count, superhost_pct, satisfaction
+    
+    def _correlation_input(self, columns: List[str]) -> pd.DataFrame:
+        """Correlation matrix of the available columns"""
+        available_cols = [col for col in columns if col in self.df.columns]
+        return self.df[available_cols].corr()
+    
+    @staticmethod
+    def _figure_to_png(fig, dpi: int) -> bytes:
+        """Render a figure to PNG bytes and close it"""
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+        plt.close(fig)
+        return buffer.getvalue()
 
 if __name__ == "__main__":
     # Example usage